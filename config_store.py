@@ -0,0 +1,127 @@
+import atexit
+import copy
+import json
+import os
+import threading
+
+
+class ConfigStore:
+    """In-memory cache of every pid's config.json.
+
+    A config is parsed once and served from memory until the file's mtime
+    changes or it is saved through the store. Saves are written atomically
+    (temporary file + rename). Frame updates sent with every /upload are
+    applied in memory at once and written to disk after `flush_delay`
+    seconds, so a burst of screenshots results in at most one write.
+    Pending frames are put on top of the file as it is when written, so a
+    save made by another worker process in the meantime is kept.
+    """
+
+    def __init__(self, default_config, get_config_path, on_load=None, flush_delay=2.0):
+        self.default_config = default_config
+        self.get_config_path = get_config_path
+        self.on_load = on_load
+        self.flush_delay = flush_delay
+        self._configs = {}  # pid -> (mtime_ns, config)
+        self._timers = {}  # pid -> pending frame flush
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
+    def _read(self, pid):
+        config_path = self.get_config_path(pid)
+        config = None
+        if os.path.exists(config_path):
+            with open(config_path, "r") as f:
+                config = json.load(f)
+            current_major_version = config.get("version", "1.0.0").split(".")[0]
+            default_major_version = self.default_config["version"].split(".")[0]
+            if current_major_version != default_major_version:
+                new_path = f"{config_path}.v{config.get('version', '1.0.0')}"
+                os.rename(config_path, new_path)
+                config = None
+
+        if config is None:
+            config = copy.deepcopy(self.default_config)
+            self._write(pid, config)
+        else:
+            self._configs[pid] = (os.stat(config_path).st_mtime_ns, config)
+        return config
+
+    def _write(self, pid, config):
+        config_path = self.get_config_path(pid)
+        tmp_path = f"{config_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(config, f, indent=4)
+        os.replace(tmp_path, config_path)
+        self._configs[pid] = (os.stat(config_path).st_mtime_ns, config)
+
+    def _current(self, pid):
+        """Return (config, reloaded) for pid, re-reading the file if it changed."""
+        cached = self._configs.get(pid)
+        if cached is not None:
+            try:
+                if os.stat(self.get_config_path(pid)).st_mtime_ns == cached[0]:
+                    return cached[1], False
+            except FileNotFoundError:
+                pass
+            if pid in self._timers:
+                # Saved elsewhere since; keep the unsaved frame update on top
+                frames = cached[1]["frames"]
+                config = self._read(pid)
+                config["frames"] = frames
+                return config, True
+        return self._read(pid), True
+
+    def load(self, pid):
+        with self._lock:
+            config, reloaded = self._current(pid)
+            config = copy.deepcopy(config)
+        if reloaded and self.on_load:
+            self.on_load(config)
+        return config
+
+    def save(self, pid, config):
+        config = copy.deepcopy(config)
+        with self._lock:
+            if pid in self._timers:
+                # The pending frame update is written along with the settings
+                config["frames"] = copy.deepcopy(self._current(pid)[0]["frames"])
+                self._cancel_flush(pid)
+            self._write(pid, config)
+        if self.on_load:
+            self.on_load(config)
+
+    def update_frames(self, pid, frames):
+        with self._lock:
+            config, _ = self._current(pid)
+            if config["frames"] == frames:
+                return
+            config["frames"] = copy.deepcopy(frames)
+            if pid not in self._timers:
+                timer = threading.Timer(self.flush_delay, self._flush_pid, args=(pid,))
+                timer.daemon = True
+                self._timers[pid] = timer
+                timer.start()
+
+    def _cancel_flush(self, pid):
+        timer = self._timers.pop(pid, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _flush_pid(self, pid):
+        with self._lock:
+            if pid not in self._timers:
+                return
+            try:
+                config, _ = self._current(pid)
+                self._write(pid, config)
+            except Exception as e:
+                print(f"[ERROR] Failed to save config for {pid}: {e}")
+            finally:
+                self._timers.pop(pid, None)
+
+    def flush(self):
+        with self._lock:
+            for pid in list(self._timers):
+                self._timers[pid].cancel()
+                self._flush_pid(pid)
@@ -0,0 +1,56 @@
+import asyncio
+import os
+import queue
+import threading
+
+
+class EventLoopThread:
+    """An asyncio event loop in a daemon thread, driven from request threads.
+
+    The loop starts on first use, and again in a forked worker process,
+    which doesn't inherit the thread.
+    """
+
+    def __init__(self, name="event-loop"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+
+    def _get_loop(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                ).start()
+            return self._loop
+
+    def run(self, coroutine, timeout=None):
+        """Run a coroutine on the loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+        return future.result(timeout)
+
+    def iterate(self, async_iterator):
+        """Yield the items of an async iterator as the loop produces them."""
+        items = queue.Queue()
+        end = object()
+
+        async def pump():
+            try:
+                async for item in async_iterator:
+                    items.put((item, None))
+                items.put((end, None))
+            except BaseException as e:
+                items.put((end, e))
+                raise
+
+        asyncio.run_coroutine_threadsafe(pump(), self._get_loop())
+        while True:
+            item, error = items.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
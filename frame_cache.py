@@ -0,0 +1,85 @@
+import json
+import threading
+from collections import deque
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2", "opencv-python")
+np = lazy_import("numpy")
+
+
+def dhash(image: "np.ndarray", hash_size: int = 16, bgr: bool = False) -> int:
+    """Difference hash of a color or grayscale frame as a hash_size² bit integer."""
+    if image.ndim == 3:
+        if image.shape[2] == 4:
+            code = cv2.COLOR_BGRA2GRAY if bgr else cv2.COLOR_RGBA2GRAY
+        else:
+            code = cv2.COLOR_BGR2GRAY if bgr else cv2.COLOR_RGB2GRAY
+        image = cv2.cvtColor(image, code)
+    small = cv2.resize(image, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def config_signature(config) -> str:
+    """Settings that influence the response for a given frame."""
+    return json.dumps(
+        [
+            config["frames"],
+            config["image_processing"],
+            config["paddleocr"],
+            config["translation"],
+            config["text_processing"],
+        ],
+        sort_keys=True,
+    )
+
+
+class FrameCache:
+    """Per-pid cache of recent /upload responses keyed by a perceptual hash.
+
+    A frame whose hash is within `max_distance` bits of a recently seen one
+    (under the same settings) gets the stored response back without running
+    image processing, OCR or translation again. A negative `max_distance`
+    disables the cache.
+    """
+
+    def __init__(self, max_distance: int = -1, entries_per_pid: int = 8):
+        self.max_distance = max_distance
+        self.entries_per_pid = entries_per_pid
+        self._frames = {}  # pid -> (signature, deque of (hash, response))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return self.max_distance >= 0
+
+    def lookup(self, pid, signature, frame_hash):
+        with self._lock:
+            signature_entries = self._frames.get(pid)
+            if signature_entries and signature_entries[0] == signature:
+                for cached_hash, response in signature_entries[1]:
+                    if (cached_hash ^ frame_hash).bit_count() <= self.max_distance:
+                        self.hits += 1
+                        return response
+            self.misses += 1
+            return None
+
+    def store(self, pid, signature, frame_hash, response):
+        with self._lock:
+            signature_entries = self._frames.get(pid)
+            if not signature_entries or signature_entries[0] != signature:
+                signature_entries = (signature, deque(maxlen=self.entries_per_pid))
+                self._frames[pid] = signature_entries
+            signature_entries[1].appendleft((frame_hash, response))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -1,42 +1,42 @@
+import functools
 import re
 
+ELLIPSIS_RE = re.compile(r"\.{2,}")
+CJK_RE = re.compile(
+    "["
+    "\u4e00-\u9fff"  # CJK Unified Ideographs
+    "\u3040-\u309f"  # Hiragana
+    "\u30a0-\u30ff"  # Katakana
+    "\uac00-\ud7af"  # Hangul
+    "]"
+)
+# A sentence runs up to an ellipsis or a terminator; the last one may lack it
+SENTENCE_RE = re.compile(r"[^.!?。！？]*(?:\.\.\.|[.!?。！？])|[^.!?。！？]+")
+
 
 def normalize_ellipsis(text):
-    return re.sub(r"\.{2,}", "...", text)
+    return ELLIPSIS_RE.sub("...", text)
 
 
 def get_aspect_ratio(text):
-    cjk_count = sum(1 for ch in text if is_cjk(ch))
-    return 1.05 if cjk_count / max(len(text), 1) > 0.5 else 0.57
+    return 1.05 if is_cjk_text(text) else 0.57
 
 
 def is_cjk(char):
-    return any(
-        [
-            "\u4e00" <= char <= "\u9fff",  # CJK Unified Ideographs
-            "\u3040" <= char <= "\u309f",  # Hiragana
-            "\u30a0" <= char <= "\u30ff",  # Katakana
-            "\uac00" <= char <= "\ud7af",  # Hangul
-        ]
-    )
+    return CJK_RE.match(char) is not None
 
 
+@functools.lru_cache(maxsize=4096)
 def is_cjk_text(text):
-    cjk_count = sum(1 for char in text if is_cjk(char))
+    # Computed once per text and shared by wrap_text, get_aspect_ratio and layout
+    cjk_count = len(text) - len(CJK_RE.sub("", text))
     return cjk_count / max(len(text), 1) > 0.5
 
 
 def wrap_text(text, max_chars_per_line):
     if is_cjk_text(text):
-        lines, current_line = [], ""
-        for char in text:
-            current_line += char
-            if len(current_line) >= max_chars_per_line:
-                lines.append(current_line)
-                current_line = ""
-        if current_line:
-            lines.append(current_line)
-        return "\n".join(lines)
+        step = max(max_chars_per_line, 1)
+        return "\n".join(text[i : i + step] for i in range(0, len(text), step))
     else:
         lines, current_line, length = [], [], 0
         for word in text.split():
@@ -59,21 +59,5 @@ def to_hex_16(num):
 
 def split_into_sentences(text):
     text = normalize_ellipsis(text)
-    sentences = []
-    current_sentence = ""
-    i = 0
-    n = len(text)
-    while i < n:
-        char = text[i]
-        current_sentence += char
-
-        if char in {".", "!", "?", "。", "！", "？"}:
-            if char == "." and i + 2 < n and text[i + 1] == "." and text[i + 2] == ".":
-                current_sentence += ".."
-                i += 2
-            sentences.append(current_sentence.strip())
-            current_sentence = ""
-        i += 1
-    if current_sentence.strip():
-        sentences.append(current_sentence.strip())
-    return sentences
+    sentences = (sentence.strip() for sentence in SENTENCE_RE.findall(text))
+    return [sentence for sentence in sentences if sentence]
@@ -0,0 +1,122 @@
+import math
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2", "opencv-python")
+np = lazy_import("numpy")
+
+# Pillow's fixed-point ITU-R 601-2 luma weights used by convert("L")
+LUMA_WEIGHTS = (19595, 38470, 7471)
+# ImageFilter.SMOOTH, the degenerate image of ImageEnhance.Sharpness
+SMOOTH_KERNEL = ((1, 1, 1), (1, 5, 1), (1, 1, 1))
+SMOOTH_KERNEL_SCALE = 13
+
+
+def to_gray(image: "np.ndarray", bgr: bool = False) -> "np.ndarray":
+    """Grayscale conversion matching PIL's convert("L")."""
+    if image.ndim == 2:
+        return image
+    weights = LUMA_WEIGHTS[::-1] if bgr else LUMA_WEIGHTS
+    gray = image[..., 0].astype(np.uint32) * weights[0]
+    gray += image[..., 1].astype(np.uint32) * weights[1]
+    gray += image[..., 2].astype(np.uint32) * weights[2]
+    gray += 0x8000
+    gray >>= 16
+    return gray.astype(np.uint8)
+
+
+def _blend_lut(lut: "np.ndarray", degenerate: float, factor: float) -> "np.ndarray":
+    # Same arithmetic as PIL's ImageEnhance (Image.blend in single precision)
+    values = np.float32(degenerate) + np.float32(factor) * (
+        lut.astype(np.float32) - np.float32(degenerate)
+    )
+    return np.clip(values, 0, 255).astype(np.uint8)
+
+
+def _box_kernel(radius: float, passes: int = 3) -> "np.ndarray":
+    """Fractional box of PIL's GaussianBlur, which runs it `passes` times per axis."""
+    sigma2 = radius * radius / passes
+    box_length = math.sqrt(12.0 * sigma2 + 1.0)
+    whole = math.floor((box_length - 1.0) / 2.0)
+    fraction = (2 * whole + 1) * (whole * (whole + 1) - 3 * sigma2)
+    fraction /= 6 * (sigma2 - (whole + 1) * (whole + 1))
+    box_radius = whole + fraction
+    box = np.full(2 * int(box_radius) + 3, 1.0 / (2 * box_radius + 1))
+    box[0] = box[-1] = (box_radius - int(box_radius)) / (2 * box_radius + 1)
+    return box.astype(np.float32)
+
+
+def _apply_lut(image, lut, out, skip_alpha):
+    if skip_alpha and image.ndim == 3 and image.shape[2] == 4:
+        lut = np.dstack([lut, lut, lut, np.arange(256, dtype=np.uint8)])
+    return cv2.LUT(image, lut, dst=out)
+
+
+def apply_image_processing(image: "np.ndarray", settings, bgr: bool = False):
+    """Apply the web UI's image settings to an RGB(A)/BGR(A) or gray frame.
+
+    Equivalent to the former PIL chain (Contrast, Brightness, Sharpness,
+    GaussianBlur, threshold, invert) within a small per-pixel tolerance, but
+    contrast, brightness, threshold and invert are folded into 256-entry
+    lookup tables and all steps after the first reuse one output buffer.
+    The input array is never modified; it is returned as is when no
+    setting is active.
+    """
+    identity = np.arange(256, dtype=np.uint8)
+    lut = identity
+    if settings["contrast"] != 1.0:
+        mean = int(to_gray(image, bgr).mean() + 0.5)
+        lut = _blend_lut(lut, mean, settings["contrast"])
+    if settings["brightness"] != 1.0:
+        lut = _blend_lut(lut, 0, settings["brightness"])
+
+    spatial = settings["sharpness"] != 1.0 or settings["blur_radius"] > 0
+    threshold = settings["threshold"] > 0
+    invert = settings["invert"]
+    has_alpha = image.ndim == 3 and image.shape[2] == 4
+    if invert and not spatial and not threshold and not has_alpha:
+        lut = 255 - lut
+        invert = False
+
+    out = None
+    if lut is not identity:
+        out = _apply_lut(image, lut, None, skip_alpha=True)
+
+    if settings["sharpness"] != 1.0:
+        src = image if out is None else out
+        factor = settings["sharpness"]
+        kernel = np.array(SMOOTH_KERNEL, dtype=np.float32) / SMOOTH_KERNEL_SCALE
+        kernel *= np.float32(1 - factor)
+        kernel[1, 1] += np.float32(factor)
+        sharpened = cv2.filter2D(src, -1, kernel, borderType=cv2.BORDER_REPLICATE)
+        # PIL leaves the outermost pixels unfiltered and keeps alpha as is
+        sharpened[0, :] = src[0, :]
+        sharpened[-1, :] = src[-1, :]
+        sharpened[:, 0] = src[:, 0]
+        sharpened[:, -1] = src[:, -1]
+        if has_alpha:
+            sharpened[..., 3] = src[..., 3]
+        out = sharpened
+
+    if settings["blur_radius"] > 0:
+        src = image if out is None else out
+        box = _box_kernel(settings["blur_radius"])
+        one = np.ones(1, dtype=np.float32)
+        for kernel_x, kernel_y in [(box, one)] * 3 + [(one, box)] * 3:
+            out = cv2.sepFilter2D(
+                src, -1, kernel_x, kernel_y, dst=out, borderType=cv2.BORDER_REPLICATE
+            )
+            src = out
+
+    if threshold:
+        gray = to_gray(image if out is None else out, bgr)
+        lut = np.where(identity > settings["threshold"], 255, 0).astype(np.uint8)
+        if invert:
+            lut = 255 - lut
+        return cv2.LUT(gray, lut, dst=None if gray is image else gray)
+
+    if invert:
+        # Image.eval inverts every band, alpha included
+        src = image if out is None else out
+        out = _apply_lut(src, 255 - identity, out, skip_alpha=False)
+
+    return image if out is None else out
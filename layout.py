@@ -0,0 +1,105 @@
+import functools
+import helpers
+
+MIN_FONT_SIZE = 8
+
+
+def _word_line_stats(word_lengths, max_chars):
+    """(lines, longest line) of helpers.wrap_text for non-CJK text, without building it."""
+    lines = longest = 0
+    line_size = words_in_line = length = 0
+    for word_length in word_lengths:
+        separator = 1 if words_in_line else 0
+        if length + word_length + separator <= max_chars:
+            line_size += word_length + separator
+            words_in_line += 1
+            length += word_length + 1
+        else:
+            lines += 1
+            longest = max(longest, line_size)
+            line_size = length = word_length
+            words_in_line = 1
+    if words_in_line:
+        lines += 1
+        longest = max(longest, line_size)
+    return max(lines, 1), longest
+
+
+def _char_line_stats(text_length, max_chars):
+    """(lines, longest line) of helpers.wrap_text for CJK text."""
+    if max_chars <= 1:
+        return text_length, 1
+    return -(-text_length // max_chars), min(text_length, max_chars)
+
+
+class _Layout:
+    """Wrapping of one text for a given frame width, memoized per line width."""
+
+    def __init__(self, text, frame_width):
+        self.text = text
+        self.frame_width = frame_width
+        cjk = helpers.is_cjk_text(text)
+        self.aspect_ratio = helpers.get_aspect_ratio(text)
+        if cjk and "\n" not in text:
+            self._line_stats = functools.partial(_char_line_stats, len(text))
+        elif cjk:
+            self._line_stats = self._wrapped_line_stats
+        else:
+            word_lengths = [len(word) for word in text.split()]
+            self._line_stats = functools.partial(_word_line_stats, word_lengths)
+        self._stats = {}
+
+    def _wrapped_line_stats(self, max_chars):
+        lines = helpers.wrap_text(self.text, max_chars).split("\n")
+        return len(lines), max(len(line) for line in lines)
+
+    def max_chars(self, font_size):
+        return int(self.frame_width / (font_size * self.aspect_ratio))
+
+    def stats(self, font_size):
+        max_chars = self.max_chars(font_size)
+        stats = self._stats.get(max_chars)
+        if stats is None:
+            stats = self._stats[max_chars] = self._line_stats(max_chars)
+        return stats
+
+    def height_fits(self, font_size, frame_height):
+        return self.stats(font_size)[0] * font_size < frame_height
+
+    def fits(self, font_size, frame_height):
+        lines, longest = self.stats(font_size)
+        char_width = font_size * self.aspect_ratio
+        return lines * font_size < frame_height and longest * char_width < self.frame_width
+
+
+@functools.lru_cache(maxsize=1024)
+def fit_text(text, frame_width, frame_height):
+    """Largest font size at which `text` wraps into the frame.
+
+    Returns (wrapped_text, font_size), the same result as stepping the font
+    size down from `frame_height` one by one. Since the wrapped height only
+    grows with the font size, the largest size that fits vertically is
+    found by binary search; from there the size is lowered until the widest
+    line fits too, which normally takes no extra step. If nothing fits,
+    the text is wrapped for the minimum size and MIN_FONT_SIZE - 1 is
+    returned, like the original loop.
+    """
+    layout = _Layout(text, frame_width)
+    if frame_height < MIN_FONT_SIZE:
+        return helpers.wrap_text(text, layout.max_chars(frame_height)), frame_height
+
+    font_size = MIN_FONT_SIZE - 1
+    if layout.height_fits(MIN_FONT_SIZE, frame_height):
+        low, high = MIN_FONT_SIZE, frame_height
+        while low < high:
+            middle = (low + high + 1) // 2
+            if layout.height_fits(middle, frame_height):
+                low = middle
+            else:
+                high = middle - 1
+        font_size = low
+        while font_size >= MIN_FONT_SIZE and not layout.fits(font_size, frame_height):
+            font_size -= 1
+
+    wrap_size = max(font_size, MIN_FONT_SIZE)
+    return helpers.wrap_text(text, layout.max_chars(wrap_size)), font_size
@@ -0,0 +1,51 @@
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Heavy dependencies (OpenCV, NumPy, PaddleOCR, SymSpell) are bound at
+    module level through this proxy, so importing the server or running
+    `--help` doesn't load them; they load when a request or warm-up task
+    first uses them. Looked-up attributes are copied onto the proxy, so
+    later accesses cost a plain attribute lookup.
+    """
+
+    def __init__(self, name, install_hint=None):
+        self.__dict__["_name"] = name
+        self.__dict__["_install_hint"] = install_hint
+        self.__dict__["_module"] = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            try:
+                module = importlib.import_module(self._name)
+            except ImportError as e:
+                if self._install_hint:
+                    raise ImportError(
+                        f"{self._name} is not installed. Run: pip install {self._install_hint}"
+                    ) from e
+                raise
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        value = getattr(self._load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name, install_hint=None):
+    return LazyModule(name, install_hint)
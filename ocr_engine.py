@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from lazy_import import lazy_import
+
+paddleocr = lazy_import("paddleocr", "paddleocr")
+
+
+class OCREnginePool:
+    """Process-wide registry of PaddleOCR engines.
+
+    Engines are keyed by (lang, use_angle_cls, rec_algorithm, det_db_score_mode).
+    Every key owns a small set of engines; a request checks one out for its
+    exclusive use and returns it afterwards, so a predictor is never shared by
+    two threads at once. Keys are evicted in LRU order once more than
+    `max_keys` distinct settings have been used.
+    """
+
+    def __init__(self, max_keys: int = 4, engines_per_key: int = 1):
+        self.max_keys = max_keys
+        self.engines_per_key = engines_per_key
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # key -> {"idle": [engines], "total": created engines}
+        self._entries = OrderedDict()
+        self.created = 0
+        self.evicted = 0
+
+    @staticmethod
+    def make_key(lang, use_angle_cls, rec_algorithm, det_db_score_mode="slow"):
+        return (lang, bool(use_angle_cls), rec_algorithm, det_db_score_mode)
+
+    def _create_engine(self, key):
+        lang, use_angle_cls, rec_algorithm, det_db_score_mode = key
+        print(f">>> Loading PaddleOCR engine: {key}")
+        return paddleocr.PaddleOCR(
+            use_angle_cls=use_angle_cls,
+            lang=lang,
+            rec_algorithm=rec_algorithm,
+            det_db_score_mode=det_db_score_mode,
+        )
+
+    def _evict_if_needed(self, keep):
+        # Only entries without checked-out engines can be dropped right away;
+        # busy ones are dropped once their engines have been returned.
+        while len(self._entries) > self.max_keys:
+            for key, entry in self._entries.items():
+                if key != keep and len(entry["idle"]) == entry["total"]:
+                    del self._entries[key]
+                    self.evicted += 1
+                    print(f">>> Evicted PaddleOCR engine: {key}")
+                    break
+            else:
+                return
+
+    def _acquire(self, key):
+        with self._lock:
+            while True:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = {"idle": [], "total": 0}
+                    self._entries[key] = entry
+                    self._evict_if_needed(keep=key)
+                self._entries.move_to_end(key)
+                if entry["idle"]:
+                    return entry["idle"].pop()
+                if entry["total"] < self.engines_per_key:
+                    entry["total"] += 1
+                    break
+                self._available.wait()
+
+        try:
+            engine = self._create_engine(key)
+        except Exception:
+            with self._lock:
+                entry["total"] -= 1
+                self._available.notify_all()
+            raise
+        with self._lock:
+            self.created += 1
+        return engine
+
+    def _release(self, key, engine):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["idle"].append(engine)
+                self._evict_if_needed(keep=None)
+            self._available.notify_all()
+
+    @contextmanager
+    def checkout(self, key):
+        engine = self._acquire(key)
+        try:
+            yield engine
+        finally:
+            self._release(key, engine)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "keys": [list(key) for key in self._entries],
+                "engines": sum(entry["total"] for entry in self._entries.values()),
+                "created": self.created,
+                "evicted": self.evicted,
+            }
@@ -0,0 +1,271 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2", "opencv-python")
+np = lazy_import("numpy")
+
+
+def sorted_boxes(boxes):
+    """Order text boxes top to bottom, then left to right, like PaddleOCR does."""
+    boxes = sorted(boxes, key=lambda box: (box[0][1], box[0][0]))
+    for i in range(len(boxes) - 1):
+        for j in range(i, -1, -1):
+            if (
+                abs(boxes[j + 1][0][1] - boxes[j][0][1]) < 10
+                and boxes[j + 1][0][0] < boxes[j][0][0]
+            ):
+                boxes[j], boxes[j + 1] = boxes[j + 1], boxes[j]
+            else:
+                break
+    return boxes
+
+
+def get_rotate_crop_image(image, points):
+    """Perspective-correct crop of a 4-point text box, as fed to recognition."""
+    width = int(
+        max(np.linalg.norm(points[0] - points[1]), np.linalg.norm(points[2] - points[3]))
+    )
+    height = int(
+        max(np.linalg.norm(points[0] - points[3]), np.linalg.norm(points[1] - points[2]))
+    )
+    target = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+    matrix = cv2.getPerspectiveTransform(points, target)
+    crop = cv2.warpPerspective(
+        image,
+        matrix,
+        (width, height),
+        borderMode=cv2.BORDER_REPLICATE,
+        flags=cv2.INTER_CUBIC,
+    )
+    if crop.shape[0] >= crop.shape[1] * 1.5:
+        crop = np.rot90(crop)
+    return crop
+
+
+class _Layout:
+    """Text boxes detected for a pid and the frame they were detected on."""
+
+    def __init__(self, ocr_key, shape, boxes, thumbnail, box_mask):
+        self.ocr_key = ocr_key
+        self.shape = shape
+        self.boxes = boxes
+        self.thumbnail = thumbnail
+        self.box_mask = box_mask
+
+
+def split_chunks(crops, count):
+    """Split crops into at most `count` consecutive runs of similar total width."""
+    total_width = sum(crop.shape[1] for crop in crops)
+    chunks, current, current_width = [], [], 0
+    for crop in crops:
+        remaining = count - len(chunks)
+        if current and remaining > 1 and current_width >= total_width / remaining:
+            chunks.append(current)
+            total_width -= current_width
+            current, current_width = [], 0
+        current.append(crop)
+        current_width += crop.shape[1]
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class OCRPipeline:
+    """PaddleOCR split into detection and line recognition stages.
+
+    With neither option on, a frame goes through PaddleOCR's own ocr() in
+    one call. Otherwise the stages run separately, taking engines from
+    `pool`:
+
+    - `incremental`: the boxes found by a full detection are kept per pid
+      with a downscaled grayscale copy of that frame. When pixels changed
+      outside the (slightly grown) boxes, text appeared somewhere new and
+      detection runs again; otherwise the cached boxes are cropped from the
+      new frame and only recognized. Recognized lines are also cached by a
+      hash of the crop's pixels, so unchanged lines are not recognized again.
+    - `rec_workers` > 1: the line crops are split into consecutive chunks
+      recognized concurrently, each with its own engine, and joined back in
+      reading order. Effective parallelism is bounded by the pool's
+      engines per key.
+
+    Results have the shape of PaddleOCR's ocr().
+    """
+
+    def __init__(
+        self,
+        pool,
+        drop_score=0.5,
+        diff_threshold=24,
+        max_change=0.002,
+        scale=4,
+        line_cache_entries=4096,
+        min_lines_per_worker=4,
+    ):
+        self.pool = pool
+        self.incremental = False
+        self.rec_workers = 1
+        self.drop_score = drop_score
+        self.diff_threshold = diff_threshold
+        self.max_change = max_change
+        self.scale = scale
+        self.line_cache_entries = line_cache_entries
+        self.min_lines_per_worker = min_lines_per_worker
+        self._layouts = {}  # pid -> _Layout
+        self._lines = OrderedDict()  # (ocr_key, shape, crop hash) -> (text, score)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_owner = None  # (process id, rec_workers) the executor was made for
+        self.detections = 0
+        self.reused_layouts = 0
+        self.line_hits = 0
+        self.line_misses = 0
+        self.parallel_runs = 0
+
+    def _thumbnail(self, image):
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape
+        size = (max(width // self.scale, 1), max(height // self.scale, 1))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+    def _box_mask(self, thumbnail, boxes):
+        mask = np.zeros(thumbnail.shape, dtype=np.uint8)
+        if boxes:
+            points = [np.round(box / self.scale).astype(np.int32) for box in boxes]
+            cv2.fillPoly(mask, points, 255)
+            mask = cv2.dilate(mask, np.ones((3, 3), dtype=np.uint8), iterations=2)
+        return mask > 0
+
+    def _layout_unchanged(self, layout, ocr_key, image, thumbnail):
+        if layout is None or layout.ocr_key != ocr_key or layout.shape != image.shape:
+            return False
+        changed = cv2.absdiff(thumbnail, layout.thumbnail) > self.diff_threshold
+        changed &= ~layout.box_mask
+        return np.count_nonzero(changed) <= self.max_change * changed.size
+
+    def _detect(self, ocr_key, image):
+        with self.pool.checkout(ocr_key) as ocr:
+            results = ocr.ocr(image, rec=False)
+        boxes = results[0] if results else None
+        return sorted_boxes([np.array(box, dtype=np.float32) for box in boxes or []])
+
+    def _boxes(self, pid, ocr_key, image):
+        if not self.incremental:
+            return self._detect(ocr_key, image)
+        thumbnail = self._thumbnail(image)
+        with self._lock:
+            layout = self._layouts.get(pid)
+        if self._layout_unchanged(layout, ocr_key, image, thumbnail):
+            with self._lock:
+                self.reused_layouts += 1
+            return layout.boxes
+        boxes = self._detect(ocr_key, image)
+        layout = _Layout(
+            ocr_key, image.shape, boxes, thumbnail, self._box_mask(thumbnail, boxes)
+        )
+        with self._lock:
+            self._layouts[pid] = layout
+            self.detections += 1
+        return boxes
+
+    def _recognize_chunk(self, ocr_key, crops, cls):
+        with self.pool.checkout(ocr_key) as ocr:
+            results = ocr.ocr(crops, det=False, cls=cls)
+        return [(text, float(score)) for text, score in results[0]]
+
+    def _get_executor(self):
+        # A forked worker process needs threads of its own
+        with self._lock:
+            owner = (os.getpid(), self.rec_workers)
+            if self._executor_owner != owner:
+                if self._executor is not None:
+                    # Lets running chunks finish, then frees the old threads
+                    self._executor.shutdown(wait=False)
+                self._executor_owner = owner
+                self._executor = ThreadPoolExecutor(
+                    max(self.rec_workers - 1, 1), thread_name_prefix="ocr-rec"
+                )
+            return self._executor
+
+    def _recognize_lines(self, ocr_key, crops, cls):
+        workers = min(self.rec_workers, len(crops) // self.min_lines_per_worker)
+        if workers <= 1:
+            return self._recognize_chunk(ocr_key, crops, cls)
+        chunks = split_chunks(crops, workers)
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self._recognize_chunk, ocr_key, chunk, cls)
+            for chunk in chunks[1:]
+        ]
+        lines = self._recognize_chunk(ocr_key, chunks[0], cls)
+        for future in futures:
+            lines.extend(future.result())
+        with self._lock:
+            self.parallel_runs += 1
+        return lines
+
+    def _recognize(self, ocr_key, crops, cls):
+        if not self.incremental:
+            return self._recognize_lines(ocr_key, crops, cls)
+        keys = [
+            (ocr_key, crop.shape, hashlib.blake2b(crop.tobytes(), digest_size=16).digest())
+            for crop in crops
+        ]
+        lines = [None] * len(crops)
+        with self._lock:
+            for i, key in enumerate(keys):
+                lines[i] = self._lines.get(key)
+                if lines[i] is not None:
+                    self._lines.move_to_end(key)
+                    self.line_hits += 1
+        missing = [i for i, line in enumerate(lines) if line is None]
+        if missing:
+            results = self._recognize_lines(ocr_key, [crops[i] for i in missing], cls)
+            with self._lock:
+                for i, line in zip(missing, results):
+                    lines[i] = line
+                    self._lines[keys[i]] = line
+                    self.line_misses += 1
+                while len(self._lines) > self.line_cache_entries:
+                    self._lines.popitem(last=False)
+        return lines
+
+    def ocr(self, pid, ocr_key, image, cls=True):
+        """OCR a pid's frame with the pool's engines for `ocr_key`."""
+        if not self.incremental and self.rec_workers <= 1:
+            with self.pool.checkout(ocr_key) as ocr:
+                return ocr.ocr(image, cls=cls)
+
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        elif image.shape[2] == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+        boxes = self._boxes(pid, ocr_key, image)
+        if not boxes:
+            return []
+
+        crops = [get_rotate_crop_image(image, box) for box in boxes]
+        lines = self._recognize(ocr_key, crops, cls)
+        return [
+            [
+                [box.tolist(), line]
+                for box, line in zip(boxes, lines)
+                if line[1] >= self.drop_score
+            ]
+        ]
+
+    def stats(self):
+        with self._lock:
+            lookups = self.line_hits + self.line_misses
+            return {
+                "incremental": self.incremental,
+                "rec_workers": self.rec_workers,
+                "detections": self.detections,
+                "reused_layouts": self.reused_layouts,
+                "parallel_runs": self.parallel_runs,
+                "line_cache_entries": len(self._lines),
+                "line_hit_rate": self.line_hits / lookups if lookups else 0.0,
+            }
@@ -1,22 +1,31 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, render_template, Response
 import base64
 from io import BytesIO
-from PIL import Image, ImageEnhance, ImageFilter
-import cv2
-import numpy as np
 import os
 import json
-from paddleocr import PaddleOCR
 import time
-import re
-from symspellpy import SymSpell, Verbosity
 import argparse
+import concurrent.futures
 import helpers
-import sqlite3
-import hashlib
 import threading
 import socket
-from tnx_translator import Translator, get_translator
+from tnx_translator import BatchingTranslator, Translator, get_translator
+from ocr_engine import OCREnginePool
+from ocr_pipeline import OCRPipeline
+from translation_cache import TranslationLRU
+import translation_db
+import frame_cache
+from snapshot_store import SnapshotStore
+from config_store import ConfigStore
+from image_processing import apply_image_processing
+from spell_checker import SpellChecker
+from warmup import WarmUp
+from event_loop import EventLoopThread
+import layout
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2", "opencv-python")
+np = lazy_import("numpy")
 
 # https://en.wikipedia.org/wiki/ISO_639-3
 LANGUAGE_CODES = ["eng", "rus", "ukr", "deu", "fra", "jpn", "kor", "zho", "zht"]
@@ -64,22 +73,26 @@ app = Flask(__name__)
 if not os.path.exists(SAVE_DIR):
     os.makedirs(SAVE_DIR)
 
-global_pid = None
-sym_spell = None
+last_pid = None  # most recent console, shown by the web UI's index page
+spell_checker = SpellChecker("./dictionaries/frequency_dictionary_en_82_765.txt")
 translator_type = None
 translator: Translator = None
+batch_window_ms = 0  # > 0 merges concurrent translations, see BatchingTranslator
+batch_max_items = 64
+async_translation = False  # fan sentences out from an asyncio event loop
+translation_loop = EventLoopThread("translation-loop")
+serve_workers = 1  # worker processes forked from this one by --serve
+ocr_pool = OCREnginePool()
+ocr_pipeline = OCRPipeline(ocr_pool)
+memory_cache = TranslationLRU()
+frame_responses = frame_cache.FrameCache()
+warm_up = WarmUp()
 
 
 def load_dynamic_parts(config):
-    global sym_spell
+    # The dictionary is shared by all pids, so it stays loaded once built.
     if config["text_processing"]["enable_symspellpy"]:
-        if sym_spell is None:
-            print(">>> Loading SymSpell...")
-            sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
-            dictionary_path = "./dictionaries/frequency_dictionary_en_82_765.txt"
-            sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1)
-    else:
-        sym_spell = None
+        spell_checker.load()
 
 
 def get_pid_dir(pid):
@@ -89,164 +102,62 @@ def get_pid_dir(pid):
     return pid_dir
 
 
-def get_config_path():
-    global global_pid
-    return os.path.join(get_pid_dir(global_pid), "config.json")
+snapshots = SnapshotStore(get_pid_dir)
 
 
-def get_db_path(lang_from, lang_to, translator_type):
-    global global_pid
-    return os.path.join(
-        get_pid_dir(global_pid), f"{lang_from}_{lang_to}_{translator_type}.db"
-    )
+def get_config_path(pid):
+    return os.path.join(get_pid_dir(pid), "config.json")
 
 
-def init_db(db_path):
-    if not os.path.exists(db_path):
-        sqlite3.connect(db_path).execute(
-            """
-        CREATE TABLE IF NOT EXISTS translations (
-            original_hash TEXT PRIMARY KEY,
-            original_text TEXT UNIQUE,
-            translated_text TEXT
-        )
-        """
-        )
+config_store = ConfigStore(DEFAULT_CONFIG, get_config_path, on_load=load_dynamic_parts)
 
 
-def store_cache_translation(original, translated, db_path):
-    with sqlite3.connect(db_path) as conn:
-        text_hash = hashlib.sha256(original.encode()).hexdigest()
+pid_locks = {}
+pid_locks_lock = threading.Lock()
 
-        conn.execute(
-            """
-        INSERT OR IGNORE INTO translations 
-        (original_hash, original_text, translated_text)
-        VALUES (?, ?, ?)
-        """,
-            (text_hash, original, translated),
-        )
 
-        conn.commit()
+def get_pid_lock(pid):
+    """Lock serializing read-modify-write of one pid's config and snapshots."""
+    with pid_locks_lock:
+        lock = pid_locks.get(pid)
+        if lock is None:
+            lock = pid_locks[pid] = threading.RLock()
+        return lock
 
 
-def get_cached_translation(db_path, original):
-    text_hash = hashlib.sha256(original.encode()).hexdigest()
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute(
-            "SELECT translated_text FROM translations WHERE original_hash = ?",
-            (text_hash,),
-        )
-        result = cursor.fetchone()
-        return result[0] if result else None
-
-
-def load_config():
-    config_path = get_config_path()
-    config_needs_saving = False  # Flag to indicate if config was created/reset
-
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            current_major_version = config.get("version", "1.0.0").split(".")[0]
-            default_major_version = DEFAULT_CONFIG["version"].split(".")[0]
-            if current_major_version != default_major_version:
-                new_path = f"{config_path}.v{config.get('version', '1.0.0')}"
-                os.rename(config_path, new_path)
-                config_needs_saving = True
-    else:
-        config_needs_saving = True
+def get_db_path(pid, lang_from, lang_to, translator_type):
+    return os.path.join(
+        get_pid_dir(pid), f"{lang_from}_{lang_to}_{translator_type}.db"
+    )
 
-    if config_needs_saving:
-        config = DEFAULT_CONFIG.copy()
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=4)
 
-    load_dynamic_parts(config)
-    return config
+def load_config(pid):
+    return config_store.load(pid)
 
 
-def save_config(config):
-    config_path = get_config_path()
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=4)
-    load_dynamic_parts(config)
+def save_config(pid, config):
+    config_store.save(pid, config)
 
 
 def spell_correct(text):
-    global sym_spell
-    if sym_spell is None:
-        return text
     try:
-        words = re.findall(r"\w+(?:-\w+)*|[^\w\s]", text)
-        corrected = []
-        corrections = []
-
-        for word in words:
-            if word.isalpha():
-                is_capitalized = word[0].isupper()
-                original_word = word
-
-                if word.lower() in sym_spell.words:
-                    corrected.append(word)
-                    continue
-
-                suggestions = sym_spell.lookup(
-                    word.lower(), Verbosity.CLOSEST, max_edit_distance=1
-                )
-                if suggestions:
-                    suggestions.sort(key=lambda s: abs(len(s.term) - len(word.lower())))
-                    best = suggestions[0].term
-
-                    if is_capitalized:
-                        best = best.capitalize()
-
-                    if best.lower() != word.lower():
-                        corrections.append(f"{word} -> {best}")
-
-                    corrected.append(best)
-                else:
-                    corrected.append(word)
-            else:
-                corrected.append(word)
-
-        if corrections:
-            print("Corrections made:")
-            for correction in corrections:
-                print(correction)
-
-        return re.sub(r"\s+([.,!?;:])", r"\1", " ".join(corrected))
+        return spell_checker.correct(text)
     except Exception as e:
         print(f"[ERROR] SymSpell correction failed: {e}")
         return text
 
 
-def apply_image_processing(image, settings):
-    if settings["contrast"] != 1.0:
-        image = ImageEnhance.Contrast(image).enhance(settings["contrast"])
-    if settings["brightness"] != 1.0:
-        image = ImageEnhance.Brightness(image).enhance(settings["brightness"])
-    if settings["sharpness"] != 1.0:
-        image = ImageEnhance.Sharpness(image).enhance(settings["sharpness"])
-    if settings["blur_radius"] > 0:
-        image = image.filter(ImageFilter.GaussianBlur(settings["blur_radius"]))
-    if settings["threshold"] > 0:
-        image = image.convert("L").point(
-            lambda p: 255 if p > settings["threshold"] else 0
-        )
-    if settings["invert"]:
-        image = Image.eval(image, lambda x: 255 - x)
-    return image
+def get_ocr_key(config):
+    return OCREnginePool.make_key(
+        OCR_LANG_MAP.get(config["translation"]["src_lang"], "en"),
+        config["paddleocr"]["use_angle_cls"],
+        config["paddleocr"]["rec_algorithm"],
+        config["paddleocr"].get("det_db_score_mode", "slow"),
+    )
 
 
-def run_ocr(image: Image.Image, config):
-    ocr = PaddleOCR(
-        use_angle_cls=config["paddleocr"]["use_angle_cls"],
-        lang=OCR_LANG_MAP.get(config["translation"]["src_lang"], "en"),
-        rec_algorithm=config["paddleocr"]["rec_algorithm"],
-        det_db_score_mode="slow",
-    )
-    results = ocr.ocr(np.asarray(image), cls=True)
+def run_ocr(pid, image: "np.ndarray", config):
+    results = ocr_pipeline.ocr(pid, get_ocr_key(config), image, cls=True)
     if not results:
         return None, "No text recognized"
     text = " ".join([line[1][0] for line in results[0]])
@@ -257,131 +168,218 @@ def run_ocr(image: Image.Image, config):
 
 @app.route("/")
 def index_pid():
-    global global_pid
-    if not global_pid:
+    pid = last_pid
+    if not pid:
         return (
             "First, you need to make a request from the switch to get the current PID"
         )
-    original_exists = os.path.exists(
-        os.path.join(get_pid_dir(global_pid), "original.png")
-    )
+    original_exists = snapshots.exists(pid, "original")
     timestamp = str(time.time())
-    config = load_config()
+    config = load_config(pid)
     return render_template(
         "index.html",
         config=config,
         original_exists=original_exists,
         timestamp=timestamp,
-        pid=global_pid,
+        pid=pid,
     )
 
 
 @app.route("/save_config/<pid>", methods=["POST"])
 def save_config_pid(pid):
-    global global_pid
-    global_pid = pid
     try:
         new_config_data = request.json
-        config = load_config()
-
-        # Apply updates from new_config_data
-        if "image_processing" in new_config_data:
-            config["image_processing"].update(new_config_data["image_processing"])
-        if "text_processing" in new_config_data:
-            config["text_processing"].update(new_config_data["text_processing"])
-        if "translation_cache" in new_config_data:
-            config["translation_cache"].update(new_config_data["translation_cache"])
-
-        # Handle translation update
-        if "translation" in new_config_data:
-            config["translation"].update(new_config_data["translation"])
-
-        save_config(
-            config
-        )  # save_config just dumps to json and calls load_dynamic_parts
-        process_current_image()
+        with get_pid_lock(pid):
+            config = load_config(pid)
+
+            # Apply updates from new_config_data
+            if "image_processing" in new_config_data:
+                config["image_processing"].update(new_config_data["image_processing"])
+            if "text_processing" in new_config_data:
+                config["text_processing"].update(new_config_data["text_processing"])
+            if "translation_cache" in new_config_data:
+                config["translation_cache"].update(new_config_data["translation_cache"])
+
+            # Handle translation update
+            if "translation" in new_config_data:
+                config["translation"].update(new_config_data["translation"])
+
+            save_config(
+                pid, config
+            )  # save_config writes config.json and calls load_dynamic_parts
+            process_current_image(pid)
         return jsonify({"status": "success"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
-def process_current_image():
-    global global_pid
-    original_path = os.path.join(get_pid_dir(global_pid), "original.png")
-    if not os.path.exists(original_path):
-        return False
-    config = load_config()
-    image = Image.open(original_path)
-    processed_image = apply_image_processing(image, config["image_processing"])
-    processed_image.save(os.path.join(get_pid_dir(global_pid), "processed.png"))
-    return True
+def process_current_image(pid):
+    with get_pid_lock(pid):
+        image = snapshots.get(pid, "original")
+        if image is None:
+            return False
+        config = load_config(pid)
+        processed_image = apply_image_processing(
+            image, config["image_processing"], bgr=True
+        )
+        snapshots.put(pid, "processed", processed_image)
+        return True
 
 
 @app.route("/process_image/<pid>", methods=["POST"])
 def process_image_pid(pid):
-    global global_pid
-    global_pid = pid
-    if not process_current_image():
+    if not process_current_image(pid):
         return jsonify({"error": "No origin image found"}), 400
     return jsonify(
         {
             "original": f"/image/{pid}/original?"
-            + os.path.join(get_pid_dir(global_pid), "original.png"),
+            + os.path.join(get_pid_dir(pid), "original.png"),
             "processed": f"/image/{pid}/processed?"
-            + os.path.join(get_pid_dir(global_pid), "processed.png"),
+            + os.path.join(get_pid_dir(pid), "processed.png"),
         }
     )
 
 
-def process_ocr_and_translation(image: Image.Image, config):
-    global translator_type
-    extracted_text, error = run_ocr(image, config)
+def recognize_sentences(pid, image: "np.ndarray", config):
+    """OCR `image` and split the text into the sentences to translate."""
+    extracted_text, error = run_ocr(pid, image, config)
     if error:
         return None, None, error
+    if translator is None:
+        return None, None, "Translator is not available"
 
     sentences = [extracted_text]
     if config["text_processing"]["split_sentences"]:
         sentences = helpers.split_into_sentences(extracted_text)
+    texts = [sentence.strip() for sentence in sentences if sentence.strip()]
+    return extracted_text, texts, None
+
+
+def translate_as_completed(texts, src_lang, dest_lang):
+    """Yield (index, translation) pairs, each as soon as it is known."""
+    if isinstance(translator, BatchingTranslator):
+        indices = {}
+        for i, future in enumerate(translator.submit(texts, src_lang, dest_lang)):
+            indices.setdefault(future, []).append(i)
+        for future in concurrent.futures.as_completed(indices):
+            for i in indices[future]:
+                yield i, future.result()
+    elif async_translation:
+        yield from translation_loop.iterate(
+            translator.translate_as_completed_async(texts, src_lang, dest_lang)
+        )
+    elif type(translator).translate_batch is Translator.translate_batch:
+        # No batch endpoint, so stream the per-sentence calls one by one
+        for i, text in enumerate(texts):
+            yield i, translator.translate(text, src_lang, dest_lang)
+    else:
+        yield from enumerate(translator.translate_batch(texts, src_lang, dest_lang))
+
+
+def translate_sentences(pid, texts, config):
+    """Yield (index, translation, cached) for `texts`, cached ones first."""
     iso_src_lang = config["translation"]["src_lang"]
     src_lang = translator.convert_lang_code(iso_src_lang, LANGUAGE_CODES)
     iso_dest_lang = config["translation"]["dest_lang"]
     dest_lang = translator.convert_lang_code(iso_dest_lang, LANGUAGE_CODES)
-    translated_text = []
     cache_translation = config["translation_cache"]["cache_translation"]
     use_cache = config["translation_cache"]["use_cache"]
-    db_path = get_db_path(iso_src_lang, iso_dest_lang, translator_type)
+    db = None
     if cache_translation or use_cache:
-        init_db(db_path)
-    for sentence in sentences:
-        text = sentence.strip()
-        result = None
-        if text:
-            if use_cache:
-                result = get_cached_translation(db_path, text)
-            if not result:
-                result = translator.translate(text, src_lang, dest_lang)
-                if cache_translation:
-                    if not (result == text):
-                        store_cache_translation(text, result, db_path)
-                print(f"New translation: `{text}` -> `{result}`")
-            else:
+        db = translation_db.get_database(
+            get_db_path(pid, iso_src_lang, iso_dest_lang, translator_type)
+        )
+    cached = [None] * len(texts)
+
+    cache_key = (pid, iso_src_lang, iso_dest_lang, translator_type)
+    if use_cache:
+        for i, text in enumerate(texts):
+            cached[i] = memory_cache.get(cache_key + (text,))
+        missing = [text for text, result in zip(texts, cached) if not result]
+        db_results = db.lookup_many(missing) if missing else {}
+        for i, text in enumerate(texts):
+            if not cached[i] and db_results.get(text):
+                cached[i] = db_results[text]
+                memory_cache.put(cache_key + (text,), cached[i])
+        for i, (text, result) in enumerate(zip(texts, cached)):
+            if result:
                 print(f"Result from cache: `{text}` -> `{result}`")
-            translated_text.append(result)
+                yield i, result, True
 
+    pending = [i for i, result in enumerate(cached) if not result]
+    if not pending:
+        return
+    pending_texts = [texts[i] for i in pending]
+    new_translations = []
+    try:
+        for j, result in translate_as_completed(pending_texts, src_lang, dest_lang):
+            text = pending_texts[j]
+            if cache_translation:
+                if not (result == text):
+                    new_translations.append((text, result))
+                    memory_cache.put(cache_key + (text,), result)
+            print(f"New translation: `{text}` -> `{result}`")
+            yield pending[j], result, False
+    finally:
+        # One write per frame, even if the client stopped reading the stream
+        if new_translations:
+            db.store_many(new_translations)
+
+
+def process_ocr_and_translation(pid, image: "np.ndarray", config):
+    extracted_text, texts, error = recognize_sentences(pid, image, config)
+    if error:
+        return None, None, error
+    translated_text = [None] * len(texts)
+    for i, translation, _ in translate_sentences(pid, texts, config):
+        translated_text[i] = translation
     return extracted_text, " ".join(translated_text), None
 
 
+def ndjson(record):
+    return json.dumps(record) + "\n"
+
+
+def stream_translation(pid, extracted_text, texts, config, finish):
+    """NDJSON records: recognized text, each sentence, then `finish(text)`."""
+    yield ndjson(
+        {
+            "type": "recognized",
+            "recognized_text": extracted_text,
+            "sentences": len(texts),
+        }
+    )
+    translated_text = [None] * len(texts)
+    try:
+        for i, translation, cached in translate_sentences(pid, texts, config):
+            translated_text[i] = translation
+            yield ndjson(
+                {
+                    "type": "sentence",
+                    "index": i,
+                    "text": texts[i],
+                    "translation": translation,
+                    "cached": cached,
+                }
+            )
+        yield ndjson(finish(" ".join(translated_text)))
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        yield ndjson({"type": "error", "error": str(e)})
+
+
 @app.route("/recognize_text/<pid>", methods=["POST"])
 def recognize_text_pid(pid):
-    global global_pid
-    global_pid = pid
-    processed_path = os.path.join(get_pid_dir(global_pid), "processed.png")
-    if not os.path.exists(processed_path):
+    image = snapshots.get(pid, "processed")
+    if image is None:
         return jsonify({"error": "No processed image found"}), 400
 
-    config = load_config()
-    image = Image.open(processed_path)
-    extracted_text, translated_text, error = process_ocr_and_translation(image, config)
+    config = load_config(pid)
+    extracted_text, translated_text, error = process_ocr_and_translation(
+        pid, image, config
+    )
     if error:
         return jsonify({"error": error}), 400
 
@@ -390,16 +388,38 @@ def recognize_text_pid(pid):
     )
 
 
+@app.route("/recognize_text_stream/<pid>", methods=["POST"])
+def recognize_text_stream_pid(pid):
+    image = snapshots.get(pid, "processed")
+    if image is None:
+        return jsonify({"error": "No processed image found"}), 400
+
+    config = load_config(pid)
+    extracted_text, texts, error = recognize_sentences(pid, image, config)
+    if error:
+        return jsonify({"error": error}), 400
+
+    def finish(translated_text):
+        return {
+            "type": "done",
+            "recognized_text": extracted_text,
+            "translated_text": translated_text,
+        }
+
+    return Response(
+        stream_translation(pid, extracted_text, texts, config, finish),
+        mimetype="application/x-ndjson",
+    )
+
+
 @app.route("/image/<pid>/<type>")
 def get_image_pid(pid, type):
-    filename = (
-        "original.png"
-        if type == "original"
-        else "processed.png" if type == "processed" else None
-    )
-    if not filename:
+    if type not in SnapshotStore.KINDS:
+        return "Not found", 404
+    png = snapshots.get_png(pid, type)
+    if png is None:
         return "Not found", 404
-    return send_from_directory(get_pid_dir(pid), filename)
+    return Response(png, mimetype="image/png", headers={"Cache-Control": "no-cache"})
 
 
 def check_frame(frame):
@@ -411,30 +431,34 @@ def check_frame(frame):
     )
 
 
-@app.route("/upload", methods=["POST"])
-def upload_screenshot():
-    global global_pid
+def prepare_upload():
+    """Decode and crop a screenshot; returns one of (upload, layout, error)."""
+    global last_pid
     if "image" not in request.files:
-        return jsonify({"error": "No image file provided"}), 400
+        return None, None, (jsonify({"error": "No image file provided"}), 400)
     if "pid" not in request.form:
-        return jsonify({"error": "No PID provided"}), 400
+        return None, None, (jsonify({"error": "No PID provided"}), 400)
 
     image_file = request.files["image"]
-    global_pid = helpers.to_hex_16(int(request.form["pid"]))
-    print(f"PID: {global_pid}")
-    pid_dir = get_pid_dir(global_pid)
+    pid = helpers.to_hex_16(int(request.form["pid"]))
+    last_pid = pid
+    print(f"PID: {pid}")
 
-    try:
-        image = Image.open(image_file.stream)
-        config = load_config()
-
-        translation_frame_req = json.loads(request.form.get("translationFrame", "{}"))
-        output_frame_req = json.loads(request.form.get("outputFrame", "{}"))
+    # Decode the upload once, straight into a BGR array for OpenCV/PaddleOCR
+    image = cv2.imdecode(
+        np.frombuffer(image_file.stream.read(), np.uint8), cv2.IMREAD_COLOR
+    )
+    if image is None:
+        return None, None, (jsonify({"error": "Unsupported image format"}), 400)
+    translation_frame_req = json.loads(request.form.get("translationFrame", "{}"))
+    output_frame_req = json.loads(request.form.get("outputFrame", "{}"))
 
-        request_has_translation_frame = check_frame(translation_frame_req)
+    request_has_translation_frame = check_frame(translation_frame_req)
 
-        request_has_output_frame = check_frame(output_frame_req)
+    request_has_output_frame = check_frame(output_frame_req)
 
+    with get_pid_lock(pid):
+        config = load_config(pid)
         config_changed = False
         if request_has_translation_frame:
             config["frames"]["translation_frame"] = translation_frame_req
@@ -446,97 +470,283 @@ def upload_screenshot():
         translation_frame = config["frames"]["translation_frame"]
         output_frame = config["frames"]["output_frame"]
         if config_changed:
-            save_config(config)
+            config_store.update_frames(pid, config["frames"])
+
+    if not (check_frame(translation_frame)):
+        layout_response = {
+            "text": "At least the translation frame must be specified!",
+            "x": 10,
+            "y": 0,
+            "width": 0,
+            "height": 24,
+            "translation_frame": {
+                "startX": 0,
+                "startY": 0,
+                "endX": 0,
+                "endY": 0,
+            },
+            "output_frame": {"startX": 0, "startY": 0, "endX": 0, "endY": 0},
+            "use_output_frame": False,
+        }
+        return None, layout_response, None
 
-        if not (check_frame(translation_frame)):
-            return jsonify(
-                {
-                    "text": "At least the translation frame must be specified!",
-                    "x": 10,
-                    "y": 0,
-                    "width": 0,
-                    "height": 24,
-                    "translation_frame": {
-                        "startX": 0,
-                        "startY": 0,
-                        "endX": 0,
-                        "endY": 0,
-                    },
-                    "output_frame": {"startX": 0, "startY": 0, "endX": 0, "endY": 0},
-                    "use_output_frame": False,
-                }
-            )
+    def get_coords(frame):
+        return (
+            min(frame["startX"], frame["endX"]),
+            min(frame["startY"], frame["endY"]),
+            max(frame["startX"], frame["endX"]),
+            max(frame["startY"], frame["endY"]),
+        )
 
-        def get_coords(frame):
-            return (
-                min(frame["startX"], frame["endX"]),
-                min(frame["startY"], frame["endY"]),
-                max(frame["startX"], frame["endX"]),
-                max(frame["startY"], frame["endY"]),
-            )
+    use_output_frame = check_frame(output_frame)
+    start_x, start_y, end_x, end_y = get_coords(translation_frame)
+    render_x, render_y, render_end_x, render_end_y = get_coords(
+        output_frame if use_output_frame else translation_frame
+    )
 
-        use_output_frame = check_frame(output_frame)
-        start_x, start_y, end_x, end_y = get_coords(translation_frame)
-        render_x, render_y, render_end_x, render_end_y = get_coords(
-            output_frame if use_output_frame else translation_frame
+    if (
+        start_x >= end_x
+        or start_y >= end_y
+        or render_x >= render_end_x
+        or render_y >= render_end_y
+    ):
+        return (
+            None,
+            None,
+            (jsonify({"error": "Invalid translation or output area"}), 400),
+        )
+
+    # Negative coordinates would count from the far edge of the screenshot,
+    # and slicing needs integers (clients may send fractional positions)
+    height, width = image.shape[:2]
+    start_x, end_x = (min(max(int(round(x)), 0), width) for x in (start_x, end_x))
+    start_y, end_y = (min(max(int(round(y)), 0), height) for y in (start_y, end_y))
+    cropped_image = image[start_y:end_y, start_x:end_x]  # a view, not a copy
+    if cropped_image.size == 0:
+        return (
+            None,
+            None,
+            (jsonify({"error": "Translation area is outside the screenshot"}), 400),
         )
+    frame_key = None
+    if frame_responses.enabled:
+        frame_key = (
+            frame_cache.config_signature(config),
+            frame_cache.dhash(cropped_image, bgr=True),
+        )
+        cached_response = frame_responses.lookup(pid, *frame_key)
+        if cached_response is not None:
+            return None, cached_response, None
+
+    snapshots.put(pid, "original", cropped_image)
 
-        if (
-            start_x >= end_x
-            or start_y >= end_y
-            or render_x >= render_end_x
-            or render_y >= render_end_y
-        ):
-            return jsonify({"error": "Invalid translation or output area"}), 400
+    processed_image = apply_image_processing(
+        cropped_image, config["image_processing"], bgr=True
+    )
+    snapshots.put(pid, "processed", processed_image)
+
+    upload = {
+        "pid": pid,
+        "config": config,
+        "image": processed_image,
+        "frame_key": frame_key,
+        "render_frame": (render_x, render_y, render_end_x, render_end_y),
+        "translation_frame": translation_frame,
+        "output_frame": output_frame,
+        "use_output_frame": use_output_frame,
+    }
+    return upload, None, None
+
+
+def finish_upload(upload, translated_text):
+    """Fit the translation into the output frame and remember the response."""
+    render_x, render_y, render_end_x, render_end_y = upload["render_frame"]
+    frame_width = render_end_x - render_x
+    frame_height = render_end_y - render_y
+    wrapped_text, font_size = layout.fit_text(
+        translated_text, frame_width, frame_height
+    )
 
-        cropped_image = image.crop((start_x, start_y, end_x, end_y))
-        cropped_image.save(os.path.join(pid_dir, "original.png"))
+    response = {
+        "text": wrapped_text,
+        "x": render_x,
+        "y": render_y,
+        "width": frame_width,
+        "height": font_size,
+        "translation_frame": upload["translation_frame"],
+        "output_frame": upload["output_frame"],
+        "use_output_frame": upload["use_output_frame"],
+    }
+    if upload["frame_key"] is not None:
+        frame_responses.store(upload["pid"], *upload["frame_key"], response)
+    return response
 
-        processed_image = apply_image_processing(
-            cropped_image, config["image_processing"]
-        )
-        processed_image.save(os.path.join(pid_dir, "processed.png"))
 
-        _, translated_text, error = process_ocr_and_translation(processed_image, config)
+@app.route("/upload", methods=["POST"])
+def upload_screenshot():
+    try:
+        upload, layout_response, error_response = prepare_upload()
+        if error_response is not None:
+            return error_response
+        if layout_response is not None:
+            return jsonify(layout_response)
+
+        _, translated_text, error = process_ocr_and_translation(
+            upload["pid"], upload["image"], upload["config"]
+        )
         if error:
             return jsonify({"error": error}), 400
 
-        frame_width = render_end_x - render_x
-        frame_height = render_end_y - render_y
-        font_size = frame_height
-        aspect_ratio = helpers.get_aspect_ratio(translated_text)
-
-        while True:
-            if font_size < 8:
-                break
-            char_width = font_size * aspect_ratio
-            max_chars_per_line = int(frame_width / char_width)
-            wrapped_text = helpers.wrap_text(translated_text, max_chars_per_line)
-            lines_count = len(wrapped_text.split("\n"))
-            max_line_size = max(len(line) for line in wrapped_text.split("\n"))
-            total_height = lines_count * font_size
-            if total_height < frame_height and max_line_size * char_width < frame_width:
-                break
-            font_size -= 1
-
-        response = {
-            "text": wrapped_text,
-            "x": render_x,
-            "y": render_y,
-            "width": frame_width,
-            "height": font_size,
-            "translation_frame": translation_frame,
-            "output_frame": output_frame,
-            "use_output_frame": use_output_frame,
-        }
+        return jsonify(finish_upload(upload, translated_text))
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
 
-        return jsonify(response)
+
+@app.route("/upload_stream", methods=["POST"])
+def upload_screenshot_stream():
+    """Like /upload, but streams each sentence as NDJSON before the layout."""
+    try:
+        upload, layout_response, error_response = prepare_upload()
+        if error_response is not None:
+            return error_response
+        if layout_response is not None:
+            return Response(
+                ndjson({"type": "layout", **layout_response}),
+                mimetype="application/x-ndjson",
+            )
+
+        pid, config = upload["pid"], upload["config"]
+        extracted_text, texts, error = recognize_sentences(pid, upload["image"], config)
+        if error:
+            return jsonify({"error": error}), 400
     except Exception as e:
         import traceback
 
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+    def finish(translated_text):
+        return {"type": "layout", **finish_upload(upload, translated_text)}
+
+    return Response(
+        stream_translation(pid, extracted_text, texts, config, finish),
+        mimetype="application/x-ndjson",
+    )
+
+
+@app.route("/stats")
+def get_stats():
+    return jsonify(
+        {
+            "ocr_engines": ocr_pool.stats(),
+            "translation_cache": memory_cache.stats(),
+            "frame_cache": frame_responses.stats(),
+            "ocr_pipeline": ocr_pipeline.stats(),
+            "spell_checker": spell_checker.stats(),
+            "translator": translator.get_stats() if translator else {},
+        }
+    )
+
+
+@app.route("/ready")
+def get_ready():
+    status = warm_up.status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+def stored_configs():
+    """Configs of the pids seen in earlier runs, read without loading anything."""
+    configs = []
+    default_major_version = DEFAULT_CONFIG["version"].split(".")[0]
+    for pid in os.listdir(SAVE_DIR):
+        try:
+            with open(os.path.join(SAVE_DIR, pid, "config.json"), "r") as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if config.get("version", "1.0.0").split(".")[0] == default_major_version:
+            configs.append(config)
+    return configs
+
+
+def create_translator():
+    if async_translation:
+        # The cloud backends' async requests would otherwise fail per sentence
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("--async-translation needs httpx. Run: pip install httpx")
+    created = get_translator(translator_type, workers=serve_workers)
+    if batch_window_ms > 0:
+        created = BatchingTranslator(
+            created, max_wait_ms=batch_window_ms, max_items=batch_max_items
+        )
+    return created
+
+
+def warm_up_translator(language_pairs):
+    if serve_workers > 1:
+        # Pooled connections and CUDA state must not be shared with forked
+        # workers, so each worker sets them up on its first translation.
+        return
+    failed = []
+    for iso_src_lang, iso_dest_lang in language_pairs:
+        src_lang = translator.convert_lang_code(iso_src_lang, LANGUAGE_CODES)
+        dest_lang = translator.convert_lang_code(iso_dest_lang, LANGUAGE_CODES)
+        try:
+            if async_translation:
+                translation_loop.run(
+                    translator.translate_batch_async(["Hello."], src_lang, dest_lang)
+                )
+            else:
+                translator.translate_batch(["Hello."], src_lang, dest_lang)
+        except Exception as e:
+            print(f"[ERROR] Warm-up translation {src_lang} -> {dest_lang} failed: {e}")
+            failed.append(f"{src_lang} -> {dest_lang}")
+    if failed:
+        # Marks the task failed, so /ready reports the broken backend
+        raise RuntimeError(f"Translation failed for {', '.join(failed)}")
+
+
+def warm_up_ocr(ocr_keys):
+    sample = np.full((48, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(sample, "Hello", (8, 34), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+    for key in ocr_keys:
+        with ocr_pool.checkout(key) as ocr:
+            ocr.ocr(sample, cls=True)
+
+
+def start_warm_up(ocr_languages):
+    """Create the translator, then warm up the stored configs in the background."""
+    global translator
+    configs = stored_configs()
+    language_pairs = sorted(
+        {
+            (config["translation"]["src_lang"], config["translation"]["dest_lang"])
+            for config in configs
+        }
+    )
+    paddleocr_defaults = DEFAULT_CONFIG["paddleocr"]
+    ocr_keys = [get_ocr_key(config) for config in configs] + [
+        OCREnginePool.make_key(
+            OCR_LANG_MAP.get(lang, "en"),
+            paddleocr_defaults["use_angle_cls"],
+            paddleocr_defaults["rec_algorithm"],
+        )
+        for lang in ocr_languages
+    ]
+    ocr_keys = list(dict.fromkeys(ocr_keys))[: ocr_pool.max_keys]
+
+    if any(config["text_processing"]["enable_symspellpy"] for config in configs):
+        warm_up.start("symspell", spell_checker.load)
+    if ocr_keys:
+        warm_up.start("ocr", warm_up_ocr, ocr_keys)
+    translator = create_translator()  # raises on a missing or misconfigured one
+    warm_up.start("translator", warm_up_translator, language_pairs)
+
 
 def run_discovery_server():
     global BROADCAST_PORT
@@ -565,14 +775,147 @@ if __name__ == "__main__":
     parser.add_argument(
         "--translator",
         type=str,
-        choices=["nllb", "google", "baidu", "aliyun", "tencent", "youdao"],
+        choices=[
+            "nllb",
+            "nllb_onnx",
+            "google",
+            "baidu",
+            "aliyun",
+            "tencent",
+            "youdao",
+        ],
+    )
+    parser.add_argument(
+        "--ocr-pool-size",
+        type=int,
+        default=4,
+        help="Maximum number of distinct OCR settings kept loaded.",
+    )
+    parser.add_argument(
+        "--ocr-engines",
+        type=int,
+        default=1,
+        help="OCR engines per setting that may run concurrently.",
+    )
+    parser.add_argument(
+        "--ocr-warmup",
+        type=str,
+        default="",
+        help="Comma-separated source languages (e.g. eng,jpn) to load at startup "
+        "in addition to those of stored configs.",
+    )
+    parser.add_argument(
+        "--incremental-ocr",
+        action="store_true",
+        help="Re-run text detection only when the text layout of a console's "
+        "frames changes; otherwise recognize the previous boxes, reusing "
+        "results for unchanged lines.",
+    )
+    parser.add_argument(
+        "--ocr-rec-workers",
+        type=int,
+        default=1,
+        help="Recognize the text lines of a frame in up to this many parallel "
+        "chunks, each on its own engine (bounded by --ocr-engines).",
+    )
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=0,
+        help="Collect sentences from concurrent requests for up to this many "
+        "milliseconds and translate them in one batch (0 disables).",
+    )
+    parser.add_argument(
+        "--batch-max-items",
+        type=int,
+        default=64,
+        help="Send a translation batch as soon as it has this many sentences.",
+    )
+    parser.add_argument(
+        "--async-translation",
+        action="store_true",
+        help="Send all uncached sentences of a frame at once from an asyncio "
+        "event loop, at most TRANX_ASYNC_CONCURRENCY (default per translator) "
+        "in flight. Not used together with --batch-window-ms. Needs httpx.",
+    )
+    parser.add_argument(
+        "--memory-cache-entries",
+        type=int,
+        default=10000,
+        help="Maximum number of translations kept in memory in front of SQLite.",
+    )
+    parser.add_argument(
+        "--memory-cache-mb",
+        type=float,
+        default=16,
+        help="Maximum size of the in-memory translation cache in megabytes.",
+    )
+    parser.add_argument(
+        "--frame-dedup-distance",
+        type=int,
+        default=-1,
+        help="Reuse the previous response for screenshots whose perceptual hash "
+        "differs by at most this many bits (-1 disables).",
+    )
+    parser.add_argument(
+        "--debug-snapshots",
+        action="store_true",
+        help="Also write original.png/processed.png to the data directory "
+        "in the background.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run under a production WSGI server instead of the development server.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes in --serve mode (more than one requires gunicorn).",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=8,
+        help="Request threads per worker in --serve mode.",
     )
     args = parser.parse_args()
 
     translator_type = args.translator
-    translator = get_translator(translator_type)
+    batch_window_ms = args.batch_window_ms
+    batch_max_items = args.batch_max_items
+    async_translation = args.async_translation
+    if args.serve:
+        import serving
+
+        serve_workers = serving.effective_workers(args.workers)
+
+    memory_cache.max_entries = args.memory_cache_entries
+    memory_cache.max_bytes = int(args.memory_cache_mb * 1024 * 1024)
+    snapshots.persist = args.debug_snapshots
+    if serve_workers > 1:
+        # A pid's requests may reach any worker, so snapshots go through disk
+        snapshots.share_between_processes()
+    frame_responses.max_distance = args.frame_dedup_distance
+    ocr_pipeline.incremental = args.incremental_ocr
+    ocr_pipeline.rec_workers = args.ocr_rec_workers
+    if args.ocr_rec_workers > args.ocr_engines:
+        print(">>> --ocr-rec-workers is limited to --ocr-engines parallel engines")
+    ocr_pool.max_keys = args.ocr_pool_size
+    ocr_pool.engines_per_key = args.ocr_engines
+    start_warm_up([lang.strip() for lang in args.ocr_warmup.split(",") if lang.strip()])
 
     discovery_thread = threading.Thread(target=run_discovery_server, daemon=True)
     discovery_thread.start()
 
-    app.run(host="0.0.0.0", port=TRANX_PORT)
+    if args.serve:
+        if serve_workers > 1:
+            # Workers are forked with whatever the master has loaded by then
+            warm_up.wait()
+
+        serving.serve(
+            app, "0.0.0.0", TRANX_PORT, workers=serve_workers, threads=args.threads
+        )
+    else:
+        app.run(host="0.0.0.0", port=TRANX_PORT, threaded=True)
@@ -0,0 +1,63 @@
+import os
+
+
+def effective_workers(workers):
+    """Number of worker processes `serve` will actually run."""
+    if workers > 1 and os.name == "nt":
+        print(">>> Multiple workers are not supported on Windows, using one")
+        return 1
+    return workers
+
+
+def serve(app, host, port, workers=1, threads=8, timeout=120):
+    """Run `app` under a production WSGI server instead of Flask's dev server.
+
+    A single worker is served by waitress with a thread pool (this also works
+    on Windows). With several workers gunicorn forks them from the current
+    process after everything loaded so far, such as the translator and
+    preloaded OCR engines, so their memory is shared copy-on-write. Threads
+    started before calling this, like the UDP discovery server, keep running
+    in the master process only.
+    """
+    if workers > 1 and os.name != "nt":
+        return _serve_gunicorn(app, host, port, workers, threads, timeout)
+    return _serve_waitress(app, host, port, threads)
+
+
+def _serve_waitress(app, host, port, threads):
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        raise ImportError(
+            "Production serving requires waitress. Run: pip install waitress"
+        )
+
+    print(f">>> Serving on {host}:{port} with waitress ({threads} threads)")
+    waitress_serve(app, host=host, port=port, threads=threads)
+
+
+def _serve_gunicorn(app, host, port, workers, threads, timeout):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise ImportError(
+            "Multiple workers require gunicorn. Run: pip install gunicorn"
+        )
+
+    class PreloadedApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("threads", threads)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("timeout", timeout)
+            self.cfg.set("preload_app", True)
+
+        def load(self):
+            return app
+
+    print(
+        f">>> Serving on {host}:{port} with gunicorn "
+        f"({workers} workers x {threads} threads)"
+    )
+    PreloadedApplication().run()
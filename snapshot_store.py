@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2", "opencv-python")
+
+
+class SnapshotStore:
+    """Latest original/processed crop of every pid, kept in memory.
+
+    The web UI's images are encoded to PNG only when requested. In debug
+    snapshot mode the crops are additionally written to `<pid_dir>/<kind>.png`
+    by a background thread with fast compression; the request path never
+    touches the disk. Files left by earlier runs are still served when
+    nothing newer is in memory.
+
+    When several worker processes serve requests (`share_between_processes`),
+    a pid's requests may land on different workers, so the disk is the
+    only copy: crops are written before `put` returns, reads always come
+    from the files, and files older than that call are ignored.
+    """
+
+    KINDS = ("original", "processed")
+
+    def __init__(self, get_pid_dir, persist=False, compress_level=1):
+        self.get_pid_dir = get_pid_dir
+        self.persist = persist
+        self.compress_level = compress_level
+        self._images = {}  # (pid, kind) -> BGR or grayscale array
+        self._png = {}  # (pid, kind) -> encoded PNG bytes
+        self._lock = threading.Lock()
+        self._pending = {}  # (pid, kind) -> image waiting to be written
+        self._pending_ready = threading.Condition(self._lock)
+        self._writer = None
+        self.shared_since = None  # set when files are the only shared copy
+
+    def share_between_processes(self):
+        self.persist = True
+        self.shared_since = time.time()
+
+    def _path(self, pid, kind):
+        return os.path.join(self.get_pid_dir(pid), f"{kind}.png")
+
+    def _file(self, pid, kind):
+        """Path of the pid's snapshot file, or None if there is no usable one."""
+        path = self._path(pid, kind)
+        try:
+            modified = os.path.getmtime(path)
+        except OSError:
+            return None
+        if self.shared_since is not None and modified < self.shared_since:
+            return None  # left by an earlier run
+        return path
+
+    def put(self, pid, kind, image):
+        key = (pid, kind)
+        if self.shared_since is not None:
+            self._write(key, self._encode(image))
+            return
+        with self._lock:
+            self._images[key] = image
+            self._png.pop(key, None)
+            if self.persist:
+                self._pending[key] = image
+                self._ensure_writer()
+                self._pending_ready.notify()
+
+    def get(self, pid, kind):
+        with self._lock:
+            image = self._images.get((pid, kind))
+        if image is None:
+            path = self._file(pid, kind)
+            if path is not None:
+                image = cv2.imread(path, cv2.IMREAD_COLOR)
+        return image
+
+    def exists(self, pid, kind):
+        with self._lock:
+            if (pid, kind) in self._images:
+                return True
+        return self._file(pid, kind) is not None
+
+    def get_png(self, pid, kind):
+        key = (pid, kind)
+        with self._lock:
+            png = self._png.get(key)
+            image = self._images.get(key)
+        if png is not None:
+            return png
+        if image is None:
+            path = self._file(pid, kind)
+            if path is None:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        png = self._encode(image)
+        with self._lock:
+            if self._images.get(key) is image:
+                self._png[key] = png
+        return png
+
+    def _encode(self, image):
+        _, png = cv2.imencode(
+            ".png", image, [cv2.IMWRITE_PNG_COMPRESSION, self.compress_level]
+        )
+        return png.tobytes()
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._pending_ready.wait()
+                key, image = self._pending.popitem()
+                png = self._png.get(key) if self._images.get(key) is image else None
+            try:
+                self._write(key, png if png is not None else self._encode(image))
+            except Exception as e:
+                print(f"[ERROR] Failed to write {key[1]} snapshot for {key[0]}: {e}")
+
+    def _write(self, key, png):
+        path = self._path(*key)
+        # Unique per thread and process, as several may write the same pid
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
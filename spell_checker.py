@@ -0,0 +1,121 @@
+import functools
+import os
+import re
+import threading
+from lazy_import import lazy_import
+
+symspellpy = lazy_import("symspellpy", "symspellpy")
+
+TOKEN_RE = re.compile(r"\w+(?:-\w+)*|[^\w\s]")
+SPACE_BEFORE_PUNCTUATION_RE = re.compile(r"\s+([.,!?;:])")
+
+
+class SpellChecker:
+    """SymSpell word correction with a dictionary shared by all pids.
+
+    The dictionary is loaded on first use and kept for the life of the
+    process, even while every pid has correction turned off. The built
+    SymSpell index (words plus precomputed deletes) is pickled next to the
+    dictionary file and reused as long as it is newer than it, so later
+    starts skip rebuilding the deletes. Corrections are memoized per
+    lowercase word.
+    """
+
+    def __init__(
+        self, dictionary_path, max_edit_distance=2, prefix_length=7, memo_size=65536
+    ):
+        self.dictionary_path = dictionary_path
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        base_path = os.path.splitext(dictionary_path)[0]
+        self.pickle_path = f"{base_path}.d{max_edit_distance}p{prefix_length}.pickle"
+        self.sym_spell = None
+        self._lock = threading.Lock()
+        self._best_term = functools.lru_cache(maxsize=memo_size)(self._lookup)
+
+    @property
+    def loaded(self):
+        return self.sym_spell is not None
+
+    def load(self):
+        with self._lock:
+            if self.sym_spell is None:
+                self.sym_spell = self._load_index()
+        return self.sym_spell
+
+    def _load_index(self):
+        sym_spell = symspellpy.SymSpell(
+            max_dictionary_edit_distance=self.max_edit_distance,
+            prefix_length=self.prefix_length,
+        )
+        if self._pickle_is_fresh():
+            try:
+                if sym_spell.load_pickle(self.pickle_path, compressed=False):
+                    print(">>> Loaded SymSpell index from cache")
+                    return sym_spell
+            except Exception as e:
+                print(f"[ERROR] Failed to load SymSpell index cache: {e}")
+
+        print(">>> Loading SymSpell...")
+        sym_spell.load_dictionary(self.dictionary_path, term_index=0, count_index=1)
+        try:
+            tmp_path = f"{self.pickle_path}.tmp"
+            sym_spell.save_pickle(tmp_path, compressed=False)
+            os.replace(tmp_path, self.pickle_path)
+        except Exception as e:
+            print(f"[ERROR] Failed to save SymSpell index cache: {e}")
+        return sym_spell
+
+    def _pickle_is_fresh(self):
+        try:
+            return os.path.getmtime(self.pickle_path) >= os.path.getmtime(
+                self.dictionary_path
+            )
+        except OSError:
+            return False
+
+    def _lookup(self, lower_word):
+        """Replacement for a lowercase word, or None to keep the word as is."""
+        if lower_word in self.sym_spell.words:
+            return None
+        suggestions = self.sym_spell.lookup(
+            lower_word, symspellpy.Verbosity.CLOSEST, max_edit_distance=1
+        )
+        if not suggestions:
+            return None
+        suggestions.sort(key=lambda s: abs(len(s.term) - len(lower_word)))
+        return suggestions[0].term
+
+    def correct(self, text):
+        if self.sym_spell is None:
+            return text
+        corrected = []
+        corrections = []
+        for word in TOKEN_RE.findall(text):
+            best = self._best_term(word.lower()) if word.isalpha() else None
+            if best is None:
+                corrected.append(word)
+                continue
+            if word[0].isupper():
+                best = best.capitalize()
+            if best.lower() != word.lower():
+                corrections.append(f"{word} -> {best}")
+            corrected.append(best)
+
+        if corrections:
+            print("Corrections made:")
+            for correction in corrections:
+                print(correction)
+
+        return SPACE_BEFORE_PUNCTUATION_RE.sub(r"\1", " ".join(corrected))
+
+    def stats(self):
+        info = self._best_term.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "loaded": self.loaded,
+            "memo_entries": info.currsize,
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,103 @@
+import sys
+import os
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tnx_translator import BatchingTranslator, Translator
+
+
+class RecordingTranslator(Translator):
+    """Upper-cases sentences after `delay` seconds and records every batch."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def translate(self, sentence, src_lang, dest_lang):
+        return self.translate_batch([sentence], src_lang, dest_lang)[0]
+
+    def translate_batch(self, sentences, src_lang, dest_lang):
+        with self.lock:
+            self.batches.append((src_lang, dest_lang, list(sentences)))
+        time.sleep(self.delay)
+        if "fail" in sentences:
+            raise RuntimeError("backend error")
+        return [sentence.upper() for sentence in sentences]
+
+    def get_lang_map(self):
+        return {}
+
+
+def main():
+    failures = []
+
+    def check(name, actual, expected):
+        if actual != expected:
+            failures.append(f"{name}: {actual!r} != {expected!r}")
+
+    # Duplicates within one request and across concurrent requests share a
+    # Future and are sent once, in a single batch per language pair
+    backend = RecordingTranslator()
+    batching = BatchingTranslator(backend, max_wait_ms=50)
+    results = {}
+
+    def request(name, sentences, pair=("en", "zh")):
+        results[name] = batching.translate_batch(sentences, *pair)
+
+    threads = [
+        threading.Thread(target=request, args=("first", ["a", "b", "a"])),
+        threading.Thread(target=request, args=("second", ["b", "c"])),
+        threading.Thread(target=request, args=("other pair", ["a"], ("en", "ja"))),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    check("first", results["first"], ["A", "B", "A"])
+    check("second", results["second"], ["B", "C"])
+    check("other pair", results["other pair"], ["A"])
+    batches = sorted((src, dest, sorted(batch)) for src, dest, batch in backend.batches)
+    check("batches", batches, [("en", "ja", ["a"]), ("en", "zh", ["a", "b", "c"])])
+    check("deduplicated", batching.get_stats()["batching"]["deduplicated"], 2)
+
+    # A sentence that is already being translated is not sent again
+    backend = RecordingTranslator(delay=0.2)
+    batching = BatchingTranslator(backend, max_wait_ms=5)
+    first = batching.submit(["slow"], "en", "zh")[0]
+    time.sleep(0.1)  # the batch is dispatched and waiting for the backend
+    second = batching.submit(["slow"], "en", "zh")[0]
+    check("in-flight future shared", second is first, True)
+    check("in-flight result", second.result(), "SLOW")
+    check("in-flight batches", len(backend.batches), 1)
+
+    # A lone sentence waits for the deadline; a full queue goes at once
+    backend = RecordingTranslator()
+    batching = BatchingTranslator(backend, max_wait_ms=100, max_items=4)
+    start = time.monotonic()
+    batching.translate("x", "en", "zh")
+    waited = time.monotonic() - start
+    if not 0.09 <= waited < 0.5:
+        failures.append(f"deadline: waited {waited:.3f}s for a 100 ms window")
+    start = time.monotonic()
+    batching.translate_batch(["1", "2", "3", "4"], "en", "zh")
+    waited = time.monotonic() - start
+    if waited >= 0.09:
+        failures.append(f"max_items: waited {waited:.3f}s for a full batch")
+
+    # Backend errors reach every caller of the batch
+    futures = batching.submit(["fail", "ok"], "en", "zh")
+    for future in futures:
+        error = future.exception(timeout=5)
+        check("error", str(error), "backend error")
+
+    if failures:
+        for failure in failures:
+            print(f"MISMATCH {failure}")
+    else:
+        print("OK")
+
+
+if __name__ == "__main__":
+    main()
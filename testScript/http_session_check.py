@@ -0,0 +1,96 @@
+import sys
+import os
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tnx_translator.http_session import PooledSession
+from tnx_translator.rate_limiter import RateLimiter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers with the statuses or JSON bodies queued for the request path,
+    then with 200 {"ok": true}."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so connections can be reused
+    replies = {}  # path -> list of (status, body)
+    hits = {}  # path -> requests received
+
+    def do_GET(self):
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        queued = self.replies.get(self.path)
+        status, body = queued.pop(0) if queued else (200, {"ok": True})
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def main():
+    url = start_stub()
+    failures = []
+
+    def check(name, actual, expected):
+        if actual != expected:
+            failures.append(f"{name}: {actual!r} != {expected!r}")
+
+    session = PooledSession(backoff_factor=0.01)
+    for _ in range(10):
+        session.get(url + "/reuse")
+    stats = session.stats()
+    check("connections opened", stats["connections"], 1)
+    check("connections reused", stats["reused"], 9)
+
+    StubHandler.replies["/429"] = [(429, {"error": "slow down"})]
+    check("429 retried", session.get(url + "/429").status_code, 200)
+    check("429 attempts", StubHandler.hits["/429"], 2)
+
+    StubHandler.replies["/503"] = [(503, {"error": "unavailable"})] * 2
+    check("503 retried", session.get(url + "/503").status_code, 200)
+    check("503 attempts", StubHandler.hits["/503"], 3)
+
+    # With a rate limiter, 429 and API-level throttling are retried by the
+    # session and slow the limiter down; transient API errors are not
+    limiter = RateLimiter(max_concurrency=4)
+    session = PooledSession(
+        backoff_factor=0.01,
+        is_throttled=lambda result: result.get("error") == "throttled",
+        is_transient=lambda result: result.get("error") == "transient",
+        rate_limiter=limiter,
+    )
+    StubHandler.replies["/limited"] = [
+        (429, {"error": "slow down"}),
+        (200, {"error": "throttled"}),
+        (200, {"error": "transient"}),
+    ]
+    check("limited retried", session.get(url + "/limited").json(), {"ok": True})
+    check("limited attempts", StubHandler.hits["/limited"], 4)
+    check("throttle retries", session.stats()["throttle_retries"], 2)
+    check("transient retries", session.stats()["transient_retries"], 1)
+    check("limiter throttled", limiter.stats()["throttled"], 2)
+
+    StubHandler.replies["/exhausted"] = [(200, {"error": "throttled"})] * 10
+    check("gives up", session.get(url + "/exhausted").json(), {"error": "throttled"})
+    check("exhausted attempts", StubHandler.hits["/exhausted"], 4)
+
+    if failures:
+        for failure in failures:
+            print(f"MISMATCH {failure}")
+    else:
+        print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import itertools
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from image_processing import apply_image_processing
+
+# Largest allowed per-pixel difference, and share of flipped pixels after thresholding
+MAX_PIXEL_DIFF = 2
+MAX_THRESHOLD_FLIPS = 0.05
+
+
+def pil_image_processing(image, settings):
+    """The PIL chain image_processing.apply_image_processing replaces."""
+    if settings["contrast"] != 1.0:
+        image = ImageEnhance.Contrast(image).enhance(settings["contrast"])
+    if settings["brightness"] != 1.0:
+        image = ImageEnhance.Brightness(image).enhance(settings["brightness"])
+    if settings["sharpness"] != 1.0:
+        image = ImageEnhance.Sharpness(image).enhance(settings["sharpness"])
+    if settings["blur_radius"] > 0:
+        image = image.filter(ImageFilter.GaussianBlur(settings["blur_radius"]))
+    if settings["threshold"] > 0:
+        image = image.convert("L").point(
+            lambda p: 255 if p > settings["threshold"] else 0
+        )
+    if settings["invert"]:
+        image = Image.eval(image, lambda x: 255 - x)
+    return image
+
+
+def check(image):
+    failures = 0
+    combinations = itertools.product(
+        [1.0, 0.5, 1.8],
+        [1.0, 0.7, 1.3],
+        [1.0, 0.4, 2.0],
+        [0, 1.5],
+        [-1, 128],
+        [False, True],
+    )
+    for contrast, brightness, sharpness, blur, threshold, invert in combinations:
+        settings = {
+            "contrast": contrast,
+            "brightness": brightness,
+            "sharpness": sharpness,
+            "blur_radius": blur,
+            "threshold": threshold,
+            "invert": invert,
+        }
+        expected = np.asarray(pil_image_processing(image, settings)).astype(int)
+        actual = apply_image_processing(np.asarray(image), settings).astype(int)
+        diff = np.abs(expected - actual)
+        if threshold > 0:
+            ok = (diff > 0).mean() <= MAX_THRESHOLD_FLIPS
+        else:
+            ok = diff.max() <= MAX_PIXEL_DIFF
+        if not ok:
+            failures += 1
+            print(f"MISMATCH {image.mode} {settings}: max diff {diff.max()}")
+    return failures
+
+
+def main():
+    if len(sys.argv) > 1:
+        image = Image.open(sys.argv[1])
+    else:
+        rng = np.random.default_rng(0)
+        noise = rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+        image = Image.fromarray(noise).filter(ImageFilter.GaussianBlur(2))
+
+    failures = 0
+    for mode in ("RGB", "RGBA", "L"):
+        failures += check(image.convert(mode))
+    print("OK" if not failures else f"{failures} mismatching settings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helpers
+from layout import fit_text
+
+
+def linear_fit_text(translated_text, frame_width, frame_height):
+    """The font-fitting loop formerly inlined in server.upload_screenshot."""
+    font_size = frame_height
+    aspect_ratio = helpers.get_aspect_ratio(translated_text)
+
+    while True:
+        if font_size < 8:
+            break
+        char_width = font_size * aspect_ratio
+        max_chars_per_line = int(frame_width / char_width)
+        wrapped_text = helpers.wrap_text(translated_text, max_chars_per_line)
+        lines_count = len(wrapped_text.split("\n"))
+        max_line_size = max(len(line) for line in wrapped_text.split("\n"))
+        total_height = lines_count * font_size
+        if total_height < frame_height and max_line_size * char_width < frame_width:
+            break
+        font_size -= 1
+    return wrapped_text, font_size
+
+
+def random_text(rng):
+    kind = rng.random()
+    if kind < 0.4:
+        words = [
+            "".join(rng.choices("abcdefghij", k=rng.randint(1, 14)))
+            for _ in range(rng.randint(0, 60))
+        ]
+        return " ".join(words)
+    if kind < 0.7:
+        return "".join(rng.choices("日本語のテキスト한국어 ", k=rng.randint(1, 200)))
+    if kind < 0.8:
+        return "".join(rng.choices("日本語\n ab", k=rng.randint(1, 80)))
+    return "".join(rng.choices("ab 語。.\t", k=rng.randint(0, 120)))
+
+
+def main():
+    rng = random.Random(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+    cases = 1000
+    for _ in range(cases):
+        text = random_text(rng)
+        width = rng.randint(1, 1280)
+        height = rng.randint(8, 720)
+        expected = linear_fit_text(text, width, height)
+        actual = fit_text(text, width, height)
+        if actual != expected:
+            print(f"MISMATCH {text!r} {width}x{height}: {actual} != {expected}")
+            return
+    print(f"OK ({cases} cases)")
+
+
+if __name__ == "__main__":
+    main()
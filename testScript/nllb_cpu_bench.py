@@ -0,0 +1,136 @@
+import argparse
+import collections
+import gc
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helpers
+from tnx_translator.nllb_translator import NLLBTranslator
+
+SENTENCES = [
+    "Press the A button to continue.",
+    "You don't have enough gold to buy this item.",
+    "The door is locked. Maybe there is a key somewhere in the castle.",
+    "Save your progress before fighting the boss.",
+    "Thank you for helping us, brave traveler!",
+    "Your party has been defeated.",
+    "Do you want to overwrite the existing save data?",
+    "The merchant will return at dawn with new weapons and armor.",
+    "Hold the right trigger to sprint.",
+    "A strange noise is coming from the old well in the village square.",
+    "Quest complete: the lost sword has been returned to its owner.",
+    "Are you sure you want to quit without saving?",
+]
+
+
+def tokenize(text):
+    return list(text.replace(" ", "")) if helpers.is_cjk_text(text) else text.split()
+
+
+def bleu(candidates, references, max_n=4):
+    """Corpus BLEU of `candidates` against `references` (0-100), smoothed by +1."""
+    matches = [0] * max_n
+    totals = [0] * max_n
+    candidate_length = reference_length = 0
+    for candidate, reference in zip(candidates, references):
+        candidate, reference = tokenize(candidate), tokenize(reference)
+        candidate_length += len(candidate)
+        reference_length += len(reference)
+        for n in range(1, max_n + 1):
+            candidate_ngrams = collections.Counter(
+                tuple(candidate[i : i + n]) for i in range(len(candidate) - n + 1)
+            )
+            reference_ngrams = collections.Counter(
+                tuple(reference[i : i + n]) for i in range(len(reference) - n + 1)
+            )
+            matches[n - 1] += sum((candidate_ngrams & reference_ngrams).values())
+            totals[n - 1] += max(len(candidate) - n + 1, 0)
+    log_precision = sum(
+        math.log((match + 1) / (total + 1)) for match, total in zip(matches, totals)
+    ) / max_n
+    brevity = min(1.0, math.exp(1 - reference_length / max(candidate_length, 1)))
+    return 100 * brevity * math.exp(log_precision)
+
+
+def run(
+    title, sentences, dest_lang, repeats, translator_class=NLLBTranslator, **options
+):
+    translator = translator_class(**options)
+    translator.translate_batch(sentences[:1], "eng_Latn", dest_lang)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for sentence in sentences:
+            translator.translate(sentence, "eng_Latn", dest_lang)
+    single = (time.perf_counter() - start) / (repeats * len(sentences))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        outputs = translator.translate_batch(sentences, "eng_Latn", dest_lang)
+    batch = (time.perf_counter() - start) / repeats
+    del translator
+    gc.collect()
+    print(f"{title:<40} {single * 1000:8.0f} ms/sentence {batch * 1000:8.0f} ms/batch")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Latency and agreement of NLLB CPU settings and backends "
+        "against the former fp32 / 4 beams / 512 tokens configuration."
+    )
+    parser.add_argument("--baseline-model", default="1.3B")
+    parser.add_argument("--model", default="1.3B", help="e.g. distilled-600M")
+    parser.add_argument("--dest", default="deu_Latn")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--beams", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument(
+        "--onnx", action="store_true", help="Also run the ONNX Runtime backend."
+    )
+    args = parser.parse_args()
+
+    common = dict(num_threads=args.threads, batch_size=len(SENTENCES))
+    runs = [
+        (
+            f"{args.baseline_model} fp32 (former settings)",
+            dict(model_name=args.baseline_model, num_beams=4,
+                 max_length_ratio=0, max_length_offset=512),
+        ),
+        (
+            f"{args.model} fp32, {args.beams} beams",
+            dict(model_name=args.model, num_beams=args.beams),
+        ),
+        (
+            f"{args.model} int8, {args.beams} beams",
+            dict(model_name=args.model, num_beams=args.beams, quantize=True),
+        ),
+    ]
+    if args.onnx:
+        from tnx_translator.nllb_onnx_translator import NLLBOnnxTranslator
+
+        for quantize in (False, True):
+            runs.append(
+                (
+                    f"{args.model} onnx {'int8' if quantize else 'fp32'}, "
+                    f"{args.beams} beams",
+                    dict(
+                        model_name=args.model,
+                        num_beams=args.beams,
+                        quantize=quantize,
+                        translator_class=NLLBOnnxTranslator,
+                    ),
+                )
+            )
+    reference = None
+    for title, options in runs:
+        outputs = run(title, SENTENCES, args.dest, args.repeats, **common, **options)
+        if reference is None:
+            reference = outputs
+        else:
+            print(f"{'':<40} BLEU vs former settings: {bleu(outputs, reference):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tnx_translator.rate_limiter import RateLimiter
+
+
+class Provider:
+    """Throttles any request beyond `capacity` concurrent ones."""
+
+    def __init__(self, capacity, latency):
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+    def call(self):
+        with self.lock:
+            self.in_flight += 1
+            throttled = self.in_flight > self.capacity
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        return throttled
+
+
+def check_aimd(failures):
+    """The window backs off to the provider's capacity and stays around it.
+
+    Without backing off, 16 threads against a capacity of 3 would be
+    throttled about 80% of the time; AIMD keeps probing one step above
+    capacity, so some throttling remains.
+    """
+    provider = Provider(capacity=3, latency=0.005)
+    limiter = RateLimiter(max_concurrency=12)
+    windows = []
+    halfway = None
+    stop = time.monotonic() + 2.0
+
+    def worker():
+        while time.monotonic() < stop:
+            limiter.acquire()
+            throttled = False
+            try:
+                throttled = provider.call()
+            finally:
+                limiter.release(throttled)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    while time.monotonic() < stop:
+        windows.append(limiter.stats()["concurrency"])
+        if halfway is None and time.monotonic() > stop - 1.0:
+            halfway = limiter.stats()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    settled = windows[len(windows) // 2 :]
+    mean_window = sum(settled) / len(settled)
+    stats = limiter.stats()
+    throttled = stats["throttled"] - halfway["throttled"]
+    requests = stats["requests"] - halfway["requests"]
+    print(
+        f"AIMD: capacity 3, mean window {mean_window:.2f} "
+        f"(range {min(settled):.2f}-{max(settled):.2f}), "
+        f"{throttled}/{requests} throttled after settling"
+    )
+    if not 1.5 <= mean_window <= 4.0:
+        failures.append(f"mean window {mean_window:.2f} is not near capacity 3")
+    if max(settled) > 6:
+        failures.append(f"window grew to {max(settled):.2f} after settling")
+    if throttled > requests * 0.3:
+        failures.append(f"{throttled}/{requests} throttled after settling")
+
+
+def check_queue_time(failures):
+    """Requests beyond the quota queue for tokens, and the stats show it."""
+    limiter = RateLimiter(qps=50, max_concurrency=8)
+    requests = 50
+    start = time.monotonic()
+
+    def worker(count):
+        for _ in range(count):
+            limiter.acquire()
+            limiter.release()
+
+    threads = [threading.Thread(target=worker, args=(10,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+    stats = limiter.stats()
+    print(
+        f"Token bucket: {requests} requests at 50/s in {elapsed:.2f}s, "
+        f"queue avg {stats['queue_ms_avg']:.1f} ms, max {stats['queue_ms_max']:.1f} ms"
+    )
+    if elapsed < (requests - 1) / 50 * 0.95:
+        failures.append(f"{requests} requests at 50/s took only {elapsed:.2f}s")
+    if stats["requests"] != requests:
+        failures.append(f"recorded {stats['requests']} requests, sent {requests}")
+    if not 0 < stats["queue_ms_avg"] <= stats["queue_ms_max"]:
+        failures.append(f"queue stats {stats['queue_ms_avg']}/{stats['queue_ms_max']}")
+    if stats["in_flight"] != 0:
+        failures.append(f"{stats['in_flight']} requests still in flight")
+
+
+def check_async(failures):
+    """Coroutines share the same bucket and window as threads."""
+    limiter = RateLimiter(qps=100, max_concurrency=2)
+    peak = 0
+    in_flight = 0
+
+    async def one():
+        nonlocal peak, in_flight
+        await limiter.acquire_async()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        limiter.release()
+
+    async def main():
+        await asyncio.gather(*(one() for _ in range(20)))
+
+    asyncio.run(main())
+    stats = limiter.stats()
+    print(f"Async: peak {peak} in flight, {stats['requests']} requests")
+    if peak > 2:
+        failures.append(f"async peak {peak} exceeds max_concurrency 2")
+    if stats["requests"] != 20 or stats["queue_ms_max"] <= 0:
+        failures.append(f"async stats {stats}")
+
+
+def main():
+    failures = []
+    check_aimd(failures)
+    check_queue_time(failures)
+    check_async(failures)
+    if failures:
+        for failure in failures:
+            print(f"MISMATCH {failure}")
+    else:
+        print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["paddleocr", "paddle", "cv2", "numpy", "symspellpy", "PIL", "torch",
+                 "transformers", "alibabacloud_alimt20181012", "googletrans", "requests"]
+
+
+def import_times(statement):
+    """Run `statement` under -X importtime.
+
+    Returns ({top-level package: cumulative us}, wall seconds). Entries are
+    summed per package because modules loaded through importlib (as the
+    lazy imports are) show up as several top-level submodule entries.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue
+        package = name.strip().split(".")[0]
+        times[package] = times.get(package, 0) + int(cumulative)
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1])
+    return times, elapsed
+
+
+def report(title, statement, top=10):
+    times, elapsed = import_times(statement)
+    total = sum(times.values())
+    print(f"== {title}: {total / 1000:.1f} ms importing, {elapsed:.2f} s wall")
+    for name, cumulative in sorted(times.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {cumulative / 1000:9.1f} ms  {name}")
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    print(f"  heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+
+def main():
+    # Importing the server (what `server.py --help` pays before argparse runs)
+    report("import server", "import server")
+    # What the first request pays on top when everything is loaded eagerly
+    report(
+        "server + OCR/image stack",
+        "import server, ocr_engine, spell_checker; "
+        "server.np.zeros(1); server.cv2.imdecode; "
+        "spell_checker.symspellpy.SymSpell; ocr_engine.paddleocr.PaddleOCR",
+    )
+
+
+if __name__ == "__main__":
+    main()
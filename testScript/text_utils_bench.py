@@ -0,0 +1,138 @@
+import sys
+import os
+import random
+import re
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helpers
+
+
+# The helpers implementations before the regex rewrite, kept as reference
+def old_normalize_ellipsis(text):
+    return re.sub(r"\.{2,}", "...", text)
+
+
+def old_is_cjk(char):
+    return any(
+        [
+            "\u4e00" <= char <= "\u9fff",  # CJK Unified Ideographs
+            "\u3040" <= char <= "\u309f",  # Hiragana
+            "\u30a0" <= char <= "\u30ff",  # Katakana
+            "\uac00" <= char <= "\ud7af",  # Hangul
+        ]
+    )
+
+
+def old_is_cjk_text(text):
+    cjk_count = sum(1 for char in text if old_is_cjk(char))
+    return cjk_count / max(len(text), 1) > 0.5
+
+
+def old_get_aspect_ratio(text):
+    cjk_count = sum(1 for ch in text if old_is_cjk(ch))
+    return 1.05 if cjk_count / max(len(text), 1) > 0.5 else 0.57
+
+
+def old_wrap_text(text, max_chars_per_line):
+    if old_is_cjk_text(text):
+        lines, current_line = [], ""
+        for char in text:
+            current_line += char
+            if len(current_line) >= max_chars_per_line:
+                lines.append(current_line)
+                current_line = ""
+        if current_line:
+            lines.append(current_line)
+        return "\n".join(lines)
+    return helpers.wrap_text(text, max_chars_per_line)
+
+
+def old_split_into_sentences(text):
+    text = old_normalize_ellipsis(text)
+    sentences = []
+    current_sentence = ""
+    i = 0
+    n = len(text)
+    while i < n:
+        char = text[i]
+        current_sentence += char
+
+        if char in {".", "!", "?", "。", "！", "？"}:
+            if char == "." and i + 2 < n and text[i + 1] == "." and text[i + 2] == ".":
+                current_sentence += ".."
+                i += 2
+            sentences.append(current_sentence.strip())
+            current_sentence = ""
+        i += 1
+    if current_sentence.strip():
+        sentences.append(current_sentence.strip())
+    return sentences
+
+
+def random_text(rng, size):
+    alphabet = rng.choice(["abc de fg ", "日本語のテキスト한국어 ", "ab 語。.!?！？\n"])
+    return "".join(rng.choices(alphabet + "....", k=size))
+
+
+def check(rng, cases=2000):
+    for _ in range(cases):
+        text = random_text(rng, rng.randint(0, 300))
+        width = rng.randint(0, 40)
+        pairs = [
+            (helpers.split_into_sentences(text), old_split_into_sentences(text)),
+            (helpers.is_cjk_text(text), old_is_cjk_text(text)),
+            (helpers.get_aspect_ratio(text), old_get_aspect_ratio(text)),
+            (helpers.wrap_text(text, width), old_wrap_text(text, width)),
+        ]
+        for actual, expected in pairs:
+            if actual != expected:
+                print(f"MISMATCH {text!r} ({width}): {actual!r} != {expected!r}")
+                return False
+    print(f"OK ({cases} cases)")
+    return True
+
+
+def bench(name, new, old, number):
+    new_time = timeit.timeit(new, number=number)
+    old_time = timeit.timeit(old, number=number)
+    print(
+        f"{name:<22} old {old_time / number * 1e6:9.1f} us"
+        f"  new {new_time / number * 1e6:9.1f} us  x{old_time / new_time:.1f}"
+    )
+
+
+def main():
+    rng = random.Random(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+    if not check(rng):
+        return
+
+    latin = "Press the button. Then wait... Did it work? Yes! " * 40
+    cjk = "ボタンを押してください。しばらく待ちます！動きましたか？" * 40
+    width = 24
+    bench("split (latin)", lambda: helpers.split_into_sentences(latin),
+          lambda: old_split_into_sentences(latin), 2000)
+    bench("split (cjk)", lambda: helpers.split_into_sentences(cjk),
+          lambda: old_split_into_sentences(cjk), 2000)
+
+    # One fit_text-style round: aspect ratio plus a wrap at several widths
+    def new_round(text):
+        helpers.is_cjk_text.cache_clear()
+        helpers.get_aspect_ratio(text)
+        for max_chars in range(width, width - 8, -1):
+            helpers.wrap_text(text, max_chars)
+
+    def old_round(text):
+        old_get_aspect_ratio(text)
+        for max_chars in range(width, width - 8, -1):
+            old_wrap_text(text, max_chars)
+
+    bench("classify+wrap (latin)", lambda: new_round(latin), lambda: old_round(latin), 500)
+    bench("classify+wrap (cjk)", lambda: new_round(cjk), lambda: old_round(cjk), 500)
+    bench("is_cjk_text (cjk)", lambda: (helpers.is_cjk_text.cache_clear(),
+                                       helpers.is_cjk_text(cjk)),
+          lambda: old_is_cjk_text(cjk), 2000)
+
+
+if __name__ == "__main__":
+    main()
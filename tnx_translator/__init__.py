@@ -1,4 +1,5 @@
 from .translator_interface import Translator
 from .translator_factory import get_translator
+from .batch_scheduler import BatchingTranslator
 
-__all__ = ["Translator", "get_translator"]
+__all__ = ["Translator", "get_translator", "BatchingTranslator"]
@@ -1,19 +1,29 @@
-from typing import List, Dict
+import asyncio
+import time
+from typing import List, Dict, Optional
 from alibabacloud_alimt20181012.client import Client
 from alibabacloud_tea_openapi.models import Config
 from alibabacloud_alimt20181012.models import TranslateGeneralRequest
 from alibabacloud_tea_util.models import RuntimeOptions
 from .translator_interface import Translator
+from .rate_limiter import RateLimiter
 
 
 class AliyunTranslator(Translator):
-    def __init__(self, access_key_id: str, access_key_secret: str):
+    def __init__(
+        self,
+        access_key_id: str,
+        access_key_secret: str,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """Initialize Aliyun translator with credentials
 
         Args:
             access_key_id (str): Aliyun access key ID
             access_key_secret (str): Aliyun access key secret
+            rate_limiter (RateLimiter): Optional limit on request rate and concurrency
         """
+        self.rate_limiter = rate_limiter
         config = Config(
             access_key_id=access_key_id,
             access_key_secret=access_key_secret,
@@ -33,6 +43,89 @@ class AliyunTranslator(Translator):
         "ukr": "ru",  # Aliyun doesn't support Ukrainian, fallback to Russian
     }
 
+    # Machine translation allows 50 requests per second by default
+    max_concurrency = 10
+    MAX_THROTTLE_RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+
+    def _general_request(self, sentence: str, src_lang: str, dest_lang: str):
+        return TranslateGeneralRequest(
+            source_language=src_lang,
+            target_language=dest_lang,
+            source_text=sentence,
+            format_type="text",
+            scene="general",
+        )
+
+    @staticmethod
+    def _is_throttled(error: Exception) -> bool:
+        # Throttling, Throttling.User, Throttling.Api, ...
+        return str(getattr(error, "code", "")).startswith("Throttling")
+
+    def _translate_general(self, request, runtime):
+        """SDK call within the rate limiter, retried with backoff while throttled."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            throttled = False
+            try:
+                return self.client.translate_general_with_options(request, runtime)
+            except Exception as e:
+                throttled = self._is_throttled(e)
+                if not throttled or attempt >= self.MAX_THROTTLE_RETRIES:
+                    raise
+            finally:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(throttled)
+            time.sleep(self.BACKOFF_FACTOR * (2**attempt))
+            attempt += 1
+
+    async def _translate_general_async(self, request, runtime):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            throttled = False
+            try:
+                return await self.client.translate_general_with_options_async(
+                    request, runtime
+                )
+            except Exception as e:
+                throttled = self._is_throttled(e)
+                if not throttled or attempt >= self.MAX_THROTTLE_RETRIES:
+                    raise
+            finally:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(throttled)
+            await asyncio.sleep(self.BACKOFF_FACTOR * (2**attempt))
+            attempt += 1
+
+    def _translated_text(self, response) -> str:
+        # Handle both possible response structures
+        try:
+            translated = ""
+            if hasattr(response.body, "code"):
+                code = response.body.code
+                message = response.body.message
+                translated = response.body.data.translated
+            else:
+                code = response.body.Code
+                message = response.body.Message
+                translated = response.body.Data.Translated
+
+            if code != "200":
+                raise Exception(
+                    f"Translation failed with code {code}: {message}\nFull response: {response}"
+                )
+
+            return translated
+
+        except AttributeError as e:
+            raise Exception(
+                f"Unexpected response structure: {str(e)}\nFull response: {response}"
+            )
+
     def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
         """Translate a sentence from source language to target language
 
@@ -53,47 +146,32 @@ class AliyunTranslator(Translator):
             runtime = RuntimeOptions()
 
             # Translate sentence
-            request = TranslateGeneralRequest(
-                source_language=src_lang,
-                target_language=dest_lang,
-                source_text=sentence,
-                format_type="text",
-                scene="general",
-            )
+            request = self._general_request(sentence, src_lang, dest_lang)
 
             # Call API
-            response = self.client.translate_general_with_options(request, runtime)
-
-            # Handle both possible response structures
-            try:
-                translated = ""
-                if hasattr(response.body, "code"):
-                    code = response.body.code
-                    message = response.body.message
-                    translated = response.body.data.translated
-                else:
-                    code = response.body.Code
-                    message = response.body.Message
-                    translated = response.body.Data.Translated
-
-                if code != "200":
-                    raise Exception(
-                        f"Translation failed with code {code}: {message}\nFull response: {response}"
-                    )
-                
-                return translated
-
-            except AttributeError as e:
-                raise Exception(
-                    f"Unexpected response structure: {str(e)}\nFull response: {response}"
-                )
+            response = self._translate_general(request, runtime)
+            return self._translated_text(response)
 
         except ValueError as e:
             raise ValueError(f"Language code error: {str(e)}")
         except Exception as e:
             raise Exception(f"Translation error: {str(e)}")
 
-        return sentence  # Return original sentence on error
+    async def translate_async(
+        self, sentence: str, src_lang: str, dest_lang: str
+    ) -> str:
+        """Like `translate`, through the SDK's async client call."""
+        request = self._general_request(sentence, src_lang, dest_lang)
+        try:
+            async with self._async_limit():
+                response = await self._translate_general_async(
+                    request, RuntimeOptions()
+                )
+            return self._translated_text(response)
+        except ValueError as e:
+            raise ValueError(f"Language code error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Translation error: {str(e)}")
 
     def get_lang_map(self) -> Dict[str, str]:
         """Get the language code mapping
@@ -102,3 +180,8 @@ class AliyunTranslator(Translator):
             Dict[str, str]: Dictionary mapping standard codes to Aliyun codes
         """
         return self.ALIYUN_LANG_MAP
+
+    def get_stats(self) -> Dict:
+        if self.rate_limiter is None:
+            return {}
+        return {"rate_limit": self.rate_limiter.stats()}
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Callable, Dict, Optional
+import httpx
+from .http_session import PooledSession
+from .rate_limiter import RateLimiter
+
+
+class AsyncPooledSession:
+    """httpx.AsyncClient counterpart of PooledSession for the async path.
+
+    Takes the same options and retries the same way: transport errors,
+    HTTP 429/5xx, API-level throttling and transient API errors are
+    retried with exponential backoff; only throttling is reported to the
+    `rate_limiter`. At most `max_concurrency` requests are in flight at once;
+    later ones wait for a free slot, and for the `rate_limiter` if there
+    is one. The client is bound to the event loop it is first used on.
+    """
+
+    RETRY_STATUS = PooledSession.RETRY_STATUS
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        is_throttled: Optional[Callable[[Dict], bool]] = None,
+        is_transient: Optional[Callable[[Dict], bool]] = None,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=None)
+        self.limits = httpx.Limits(
+            max_connections=max(pool_size, max_concurrency),
+            max_keepalive_connections=pool_size,
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.is_throttled = is_throttled
+        self.is_transient = is_transient
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self._loop = None
+        self._client = None
+        self._semaphore = None
+        self.requests = 0
+        self.retries = 0
+        self.throttle_retries = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+
+    def _bind(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @staticmethod
+    def _api_error(response, check) -> bool:
+        if check is None or not response.is_success:
+            return False
+        try:
+            return check(response.json())
+        except ValueError:
+            return False
+
+    def _throttled(self, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        return self._api_error(response, self.is_throttled)
+
+    async def _send(self, method: str, url: str, **kwargs):
+        """One attempt, within the limits; returns (response, throttled)."""
+        async with self._semaphore:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            throttled = False
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            try:
+                self.requests += 1
+                response = await self._client.request(method, url, **kwargs)
+                throttled = self._throttled(response)
+                return response, throttled
+            finally:
+                self._in_flight -= 1
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(throttled)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        self._bind()
+        attempt = 0
+        while True:
+            try:
+                response, throttled = await self._send(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                self.retries += 1
+            else:
+                if attempt >= self.max_retries:
+                    return response
+                if throttled:
+                    self.throttle_retries += 1
+                elif response.status_code in self.RETRY_STATUS or self._api_error(
+                    response, self.is_transient
+                ):
+                    self.retries += 1
+                else:
+                    return response
+            await asyncio.sleep(self.backoff_factor * (2**attempt))
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttle_retries": self.throttle_retries,
+            "max_concurrency": self.max_concurrency,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
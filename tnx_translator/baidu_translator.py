@@ -1,9 +1,11 @@
+import asyncio
 import requests
 import random
 import json
 from hashlib import md5
 from typing import List, Dict
 from .translator_interface import Translator
+from .http_session import PooledSession, create_async_session
 
 
 class BaiduTranslator(Translator):
@@ -18,12 +20,21 @@ class BaiduTranslator(Translator):
         "zht": "cht",
         "ukr": "ukr",
     }
+    # Baidu recommends keeping a single query below 6000 bytes
+    MAX_QUERY_BYTES = 6000
+    # 54003 access frequency limited
+    THROTTLE_ERROR_CODES = {"54003"}
+    # 52001 request timeout, 52002 system error
+    RETRY_ERROR_CODES = {"52001", "52002"}
+    # The standard tier allows 1 query per second, the advanced tier 10
+    max_concurrency = 2
 
-    def __init__(self, app_id: str = None, app_key: str = None):
+    def __init__(self, app_id: str = None, app_key: str = None, **session_options):
         """
         Initialize the Baidu Translator.
         :param app_id: Your Baidu Translate API App ID.
         :param app_key: Your Baidu Translate API App Key.
+        :param session_options: Pool size, timeouts, retries and rate limiter for PooledSession.
         """
         if not app_id or not app_key:
             raise ValueError(
@@ -32,6 +43,13 @@ class BaiduTranslator(Translator):
         self.app_id = app_id
         self.app_key = app_key
         self.api_url = "http://api.fanyi.baidu.com/api/trans/vip/translate"
+        self.session_options = session_options
+        self.session = PooledSession(
+            is_throttled=self._is_throttled,
+            is_transient=self._is_transient,
+            **session_options,
+        )
+        self.async_session = None
         print(
             ">>> Baidu Translate initialized. Ensure APP_ID and APP_KEY are correctly set."
         )
@@ -40,40 +58,59 @@ class BaiduTranslator(Translator):
         sign_str = self.app_id + query + salt + self.app_key
         return md5(sign_str.encode("utf-8")).hexdigest()
 
-    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
-        # Baidu API seems to prefer single query for batch, but we process sentence by sentence for consistency
-        # and to handle potential individual sentence errors more gracefully.
-        # If Baidu API supports batch translation in a single request, this can be optimized.
+    def _is_throttled(self, result: Dict) -> bool:
+        return str(result.get("error_code")) in self.THROTTLE_ERROR_CODES
+
+    def _is_transient(self, result: Dict) -> bool:
+        return str(result.get("error_code")) in self.RETRY_ERROR_CODES
+
+    def _get_async_session(self):
+        if self.async_session is None:
+            self.async_session = create_async_session(
+                is_throttled=self._is_throttled,
+                is_transient=self._is_transient,
+                max_concurrency=self.max_concurrency,
+                **self.session_options,
+            )
+        return self.async_session
 
+    def _query_request(self, query: str, src_lang: str, dest_lang: str) -> Dict:
+        """Form data and headers of a signed request for `query`."""
         salt = str(random.randint(32768, 65536))
-        sign = self._make_sign(sentence, salt)
+        sign = self._make_sign(query, salt)
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         payload = {
-            "q": sentence,
+            "q": query,
             "from": src_lang,
             "to": dest_lang,
             "appid": self.app_id,
             "salt": salt,
             "sign": sign,
         }
+        return {"data": payload, "headers": headers}
 
-        try:
-            response = requests.post(self.api_url, params=payload, headers=headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            result = response.json()
+    def _query_result(self, response):
+        """`trans_result` list of a requests or httpx response, or None on API error."""
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        result = response.json()
 
-            if "trans_result" in result:
-                translated_text = " ".join(
-                    [item["dst"] for item in result["trans_result"]]
-                )
-                return translated_text
-            elif "error_code" in result:
-                print(
-                    f"Baidu API Error: {result['error_code']} - {result.get('error_msg', 'Unknown error')}"
-                )
-            else:
-                print(f"Baidu API Error: Unexpected response format: {result}")
+        if "trans_result" in result:
+            return result["trans_result"]
+        elif "error_code" in result:
+            print(
+                f"Baidu API Error: {result['error_code']} - {result.get('error_msg', 'Unknown error')}"
+            )
+        else:
+            print(f"Baidu API Error: Unexpected response format: {result}")
+        return None
 
+    def _query(self, query: str, src_lang: str, dest_lang: str):
+        """Send one request and return its `trans_result` list, or None on error."""
+        try:
+            response = self.session.post(
+                self.api_url, **self._query_request(query, src_lang, dest_lang)
+            )
+            return self._query_result(response)
         except requests.exceptions.RequestException as e:
             print(f"Translation error (Baidu HTTP): {e}")
         except json.JSONDecodeError as e:
@@ -83,7 +120,95 @@ class BaiduTranslator(Translator):
         except Exception as e:
             print(f"Translation error (Baidu): {e}")
 
-        return sentence  # Return original sentence on error
+        return None
+
+    async def _query_async(self, query: str, src_lang: str, dest_lang: str):
+        response = None
+        try:
+            response = await self._get_async_session().post(
+                self.api_url, **self._query_request(query, src_lang, dest_lang)
+            )
+            return self._query_result(response)
+        except json.JSONDecodeError as e:
+            print(
+                f"Translation error (Baidu JSON Decode): {e} - Response: {response.text}"
+            )
+        except Exception as e:
+            print(f"Translation error (Baidu HTTP): {e}")
+        return None
+
+    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+        trans_result = self._query(sentence, src_lang, dest_lang)
+        if trans_result is None:
+            return sentence  # Return original sentence on error
+        return " ".join([item["dst"] for item in trans_result])
+
+    def _line_batches(self, sentences: List[str]):
+        """(offset, sentences, lines) of each query a batch is split into."""
+        # Baidu translates every line of `q` separately and returns one
+        # `trans_result` item per line, so a batch is a newline-joined query.
+        lines = [" ".join(sentence.split()) for sentence in sentences]
+        batches = self._split_batches(
+            lines, self.MAX_QUERY_BYTES, size=lambda line: len(line.encode()) + 1
+        )
+        return [
+            (offset, sentences[offset : offset + len(batch)], batch)
+            for offset, batch in zip(self._batch_offsets(batches), batches)
+        ]
+
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        translated = []
+        for _, originals, batch in self._line_batches(sentences):
+            trans_result = self._query("\n".join(batch), src_lang, dest_lang)
+            if trans_result is None:
+                translated.extend(originals)  # Return original sentences on error
+            elif len(trans_result) != len(batch):
+                translated.extend(
+                    super().translate_batch(originals, src_lang, dest_lang)
+                )
+            else:
+                translated.extend(item["dst"] for item in trans_result)
+        return translated
+
+    async def translate_async(
+        self, sentence: str, src_lang: str, dest_lang: str
+    ) -> str:
+        trans_result = await self._query_async(sentence, src_lang, dest_lang)
+        if trans_result is None:
+            return sentence  # Return original sentence on error
+        return " ".join([item["dst"] for item in trans_result])
+
+    def _async_requests(self, sentences: List[str], src_lang: str, dest_lang: str):
+        return [
+            self._translate_lines_async(offset, originals, batch, src_lang, dest_lang)
+            for offset, originals, batch in self._line_batches(sentences)
+        ]
+
+    async def _translate_lines_async(
+        self, offset, originals, batch, src_lang, dest_lang
+    ):
+        indices = list(range(offset, offset + len(batch)))
+        trans_result = await self._query_async("\n".join(batch), src_lang, dest_lang)
+        if trans_result is None:
+            return indices, originals  # Return original sentences on error
+        if len(trans_result) != len(batch):
+            return indices, await asyncio.gather(
+                *(
+                    self.translate_async(sentence, src_lang, dest_lang)
+                    for sentence in originals
+                )
+            )
+        return indices, [item["dst"] for item in trans_result]
 
     def get_lang_map(self) -> Dict[str, str]:
         return self.BAIDU_LANG_MAP
+
+    def get_stats(self) -> Dict:
+        stats = {"http": self.session.stats()}
+        if self.async_session is not None:
+            stats["async_http"] = self.async_session.stats()
+        if self.session.rate_limiter is not None:
+            stats["rate_limit"] = self.session.rate_limiter.stats()
+        return stats
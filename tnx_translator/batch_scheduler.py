@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+from .translator_interface import Translator
+
+
+class BatchingTranslator(Translator):
+    """Merges translations requested concurrently into shared batches.
+
+    Sentences are queued per (src_lang, dest_lang) pair and sent to the
+    wrapped translator in a single `translate_batch` call once the oldest
+    one has waited `max_wait_ms` or `max_items` are queued. Each caller
+    gets a Future per sentence. A sentence that is already queued or being
+    translated for the same pair shares the existing Future instead of
+    being sent again. Up to `max_concurrent_batches` batches run at once.
+    """
+
+    def __init__(
+        self,
+        translator: Translator,
+        max_wait_ms: float = 5.0,
+        max_items: int = 64,
+        max_concurrent_batches: int = 2,
+    ):
+        self.translator = translator
+        self.max_wait = max_wait_ms / 1000
+        self.max_items = max_items
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queues = {}  # (src, dest) -> [deadline, {sentence: Future}]
+        self._in_flight = {}  # (src, dest, sentence) -> Future
+        self._lock = threading.Lock()
+        self._queued = threading.Condition(self._lock)
+        self._pid = None  # process that owns the dispatcher thread and executor
+        self._executor = None
+        self.batches = 0
+        self.sentences = 0
+        self.deduplicated = 0
+
+    def _ensure_dispatcher(self):
+        # Threads don't survive a fork, so a forked worker starts its own
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(
+                self.max_concurrent_batches, thread_name_prefix="translation-batch"
+            )
+            threading.Thread(target=self._dispatch_loop, daemon=True).start()
+
+    def submit(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[Future]:
+        """Queue sentences for translation and return one Future per sentence."""
+        pair = (src_lang, dest_lang)
+        futures = []
+        with self._lock:
+            self._ensure_dispatcher()
+            queue = self._queues.get(pair)
+            for sentence in sentences:
+                future = self._in_flight.get(pair + (sentence,))
+                if future is None and queue is not None:
+                    future = queue[1].get(sentence)
+                if future is not None:
+                    self.deduplicated += 1
+                else:
+                    if queue is None:
+                        queue = [time.monotonic() + self.max_wait, {}]
+                        self._queues[pair] = queue
+                        self._queued.notify()
+                    future = queue[1][sentence] = Future()
+                    if len(queue[1]) == self.max_items:
+                        self._queued.notify()
+                futures.append(future)
+        return futures
+
+    def _due_batches(self):
+        """Wait for queues that are full or past their deadline and take them."""
+        while True:
+            now = time.monotonic()
+            due = [
+                pair
+                for pair, (deadline, queued) in self._queues.items()
+                if deadline <= now or len(queued) >= self.max_items
+            ]
+            if due:
+                break
+            deadlines = [deadline for deadline, _ in self._queues.values()]
+            self._queued.wait(min(deadlines) - now if deadlines else None)
+
+        batches = []
+        for pair in due:
+            items = list(self._queues.pop(pair)[1].items())
+            for start in range(0, len(items), self.max_items):
+                batch = items[start : start + self.max_items]
+                for sentence, future in batch:
+                    self._in_flight[pair + (sentence,)] = future
+                batches.append((pair, batch))
+        return batches
+
+    def _dispatch_loop(self):
+        while True:
+            with self._lock:
+                batches = self._due_batches()
+            for pair, batch in batches:
+                self._executor.submit(self._run_batch, pair, batch)
+
+    def _run_batch(self, pair, batch):
+        sentences = [sentence for sentence, _ in batch]
+        try:
+            results = self.translator.translate_batch(sentences, *pair)
+            if len(results) != len(sentences):
+                raise ValueError(
+                    f"Got {len(results)} translations for {len(sentences)} sentences"
+                )
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        with self._lock:
+            for sentence in sentences:
+                self._in_flight.pop(pair + (sentence,), None)
+            self.batches += 1
+            self.sentences += len(sentences)
+
+    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+        return self.translate_batch([sentence], src_lang, dest_lang)[0]
+
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        futures = self.submit(sentences, src_lang, dest_lang)
+        return [future.result() for future in futures]
+
+    def get_lang_map(self) -> Dict[str, str]:
+        return self.translator.get_lang_map()
+
+    def convert_lang_code(self, lang_code: str, lang_codes: List[str]) -> str:
+        return self.translator.convert_lang_code(lang_code, lang_codes)
+
+    def get_stats(self) -> Dict:
+        stats = dict(self.translator.get_stats())
+        with self._lock:
+            stats["batching"] = {
+                "batches": self.batches,
+                "sentences": self.sentences,
+                "deduplicated": self.deduplicated,
+                "mean_batch_size": (
+                    self.sentences / self.batches if self.batches else 0.0
+                ),
+            }
+        return stats
@@ -16,6 +16,8 @@ class GoogleWebTranslator(Translator):
         "ukr": "uk",
         "zht": "zh-tw",
     }
+    # googletrans is blocking; the async path runs this many calls in threads
+    max_concurrency = 4
 
     def __init__(self):
         self.translator = GoogleTranslator()
@@ -0,0 +1,155 @@
+import os
+import time
+from typing import Callable, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .rate_limiter import RateLimiter
+
+
+class PooledSession:
+    """Keep-alive HTTP session owned by a single cloud translator.
+
+    Connections are pooled per host and reused across sentences. Transport
+    errors, HTTP 429 and 5xx responses are retried with exponential backoff
+    by urllib3; API-level throttling (reported inside a 200 response body)
+    is detected with `is_throttled` and retried the same way, as are
+    transient API errors detected with `is_transient`.
+
+    With a `rate_limiter` (shared by a translator's sessions), every
+    attempt waits for it, and HTTP 429 is retried here instead of by
+    urllib3 so that the limiter sees it as throttling. Transient errors
+    are retried without being reported to the limiter.
+
+    A forked worker process opens connections of its own instead of
+    sharing the sockets pooled by its parent.
+    """
+
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        is_throttled: Optional[Callable[[Dict], bool]] = None,
+        is_transient: Optional[Callable[[Dict], bool]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.is_throttled = is_throttled
+        self.is_transient = is_transient
+        self.rate_limiter = rate_limiter
+        self.throttle_retries = 0
+        self.transient_retries = 0
+        self.pool_size = pool_size
+
+        retry_status = self.RETRY_STATUS
+        if rate_limiter is not None:
+            retry_status = tuple(status for status in retry_status if status != 429)
+        self.retry = Retry(
+            total=max_retries,
+            status_forcelist=retry_status,
+            allowed_methods=None,  # translation calls are safe to repeat
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+        )
+        self._open()
+
+    def _open(self):
+        self._pid = os.getpid()  # process that owns the pooled connections
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=self.retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    @staticmethod
+    def _api_error(response, check) -> bool:
+        """Whether `check` flags the JSON body of a successful response."""
+        if check is None or not response.ok:
+            return False
+        try:
+            return check(response.json())
+        except ValueError:
+            return False
+
+    def _throttled(self, response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return self.rate_limiter is not None
+        return self._api_error(response, self.is_throttled)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if self._pid != os.getpid():
+            # Don't close the parent's session: that would shut its sockets
+            self._open()
+        attempt = 0
+        while True:
+            response, throttled = self._send(method, url, **kwargs)
+            if attempt >= self.max_retries:
+                return response
+            if throttled:
+                self.throttle_retries += 1
+            elif self._api_error(response, self.is_transient):
+                self.transient_retries += 1
+            else:
+                return response
+            time.sleep(self.backoff_factor * (2**attempt))
+            attempt += 1
+
+    def _send(self, method: str, url: str, **kwargs):
+        """One attempt, within the rate limiter; returns (response, throttled)."""
+        if self.rate_limiter is None:
+            response = self.session.request(method, url, **kwargs)
+            return response, self._throttled(response)
+        self.rate_limiter.acquire()
+        throttled = False
+        try:
+            response = self.session.request(method, url, **kwargs)
+            throttled = self._throttled(response)
+        finally:
+            self.rate_limiter.release(throttled)
+        return response, throttled
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """Connection reuse counters summed over all pooled hosts."""
+        pools = self.adapter.poolmanager.pools
+        sent = opened = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                sent += pool.num_requests
+                opened += pool.num_connections
+        return {
+            "requests": sent,
+            "connections": opened,
+            "reused": max(sent - opened, 0),
+            "throttle_retries": self.throttle_retries,
+            "transient_retries": self.transient_retries,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+def create_async_session(**options):
+    """AsyncPooledSession for a translator's async path (needs httpx)."""
+    try:
+        from .async_http import AsyncPooledSession
+    except ImportError:
+        raise ImportError("Async translation needs httpx. Run: pip install httpx")
+    return AsyncPooledSession(**options)
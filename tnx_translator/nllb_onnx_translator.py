@@ -0,0 +1,76 @@
+import os
+import shutil
+import onnxruntime
+from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from .nllb_translator import NLLBTranslator
+
+ONNX_FILES = ("encoder_model", "decoder_model", "decoder_with_past_model")
+
+
+class NLLBOnnxTranslator(NLLBTranslator):
+    """NLLB run by ONNX Runtime's CPU provider instead of eager PyTorch.
+
+    The encoder and the decoders (with and without past key/values) are
+    exported once to `export_dir` and loaded from there on later starts.
+    With `quantize` the exported graphs are additionally converted to
+    dynamic int8 once and the quantized files are used.
+    """
+
+    USE_CUDA = False
+
+    def __init__(self, export_dir="./models/onnx", **options):
+        self.export_dir = export_dir
+        super().__init__(**options)
+
+    def _session_options(self):
+        session_options = onnxruntime.SessionOptions()
+        if self.num_threads:
+            session_options.intra_op_num_threads = self.num_threads
+        return session_options
+
+    def _export(self, model_name, export_path):
+        print(f">>> Exporting {model_name} to ONNX, this is only done once...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+        tmp_path = f"{export_path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        model.save_pretrained(tmp_path)
+        os.replace(tmp_path, export_path)
+
+    def _export_quantized(self, export_path):
+        print(">>> Quantizing the ONNX export to int8, this is only done once...")
+        quantization_config = AutoQuantizationConfig.avx2(
+            is_static=False, per_channel=False
+        )
+        for name in ONNX_FILES:
+            quantizer = ORTQuantizer.from_pretrained(
+                export_path, file_name=f"{name}.onnx"
+            )
+            quantizer.quantize(
+                save_dir=export_path, quantization_config=quantization_config
+            )
+
+    def _load_model(self, model_name):
+        export_path = os.path.join(self.export_dir, model_name.replace("/", "--"))
+        if not os.path.isdir(export_path):
+            os.makedirs(self.export_dir, exist_ok=True)
+            self._export(model_name, export_path)
+        suffix = ""
+        if self.quantize:
+            suffix = "_quantized"
+            last_file = os.path.join(export_path, f"{ONNX_FILES[-1]}{suffix}.onnx")
+            if not os.path.exists(last_file):
+                self._export_quantized(export_path)
+        print(f">>> Loading ONNX model from {export_path}")
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            export_path,
+            encoder_file_name=f"encoder_model{suffix}.onnx",
+            decoder_file_name=f"decoder_model{suffix}.onnx",
+            decoder_with_past_file_name=f"decoder_with_past_model{suffix}.onnx",
+            use_cache=True,
+            provider="CPUExecutionProvider",
+            session_options=self._session_options(),
+        )
+
+    def _quantize(self, model):
+        return model  # the quantized graphs are loaded by _load_model
@@ -18,32 +18,109 @@ class NLLBTranslator(Translator):
         "zht": "zho_Hant",
     }
 
-    def __init__(self, model_name="facebook/nllb-200-1.3B"):
-        self.device = 0 if torch.cuda.is_available() else -1
-        print(">>> Loading NLLB translation model...")
+    # Shorthands accepted for model_name (e.g. through TRANX_NLLB_MODEL)
+    NLLB_MODELS = {
+        "1.3B": "facebook/nllb-200-1.3B",
+        "distilled-600M": "facebook/nllb-200-distilled-600M",
+        "distilled-1.3B": "facebook/nllb-200-distilled-1.3B",
+        "3.3B": "facebook/nllb-200-3.3B",
+    }
+    MAX_LENGTH = 512
+    USE_CUDA = True
+
+    def __init__(
+        self,
+        model_name="facebook/nllb-200-1.3B",
+        batch_size=16,
+        quantize=False,
+        num_threads=None,
+        num_beams=4,
+        max_length_ratio=2.0,
+        max_length_offset=16,
+    ):
+        """Load an NLLB checkpoint on the GPU if available, else on the CPU.
+
+        On the CPU, `quantize` converts the Linear layers to dynamic int8 and
+        `num_threads` sets torch's intra-op thread count. Generation uses
+        `num_beams` beams and at most `max_length_ratio` * input tokens +
+        `max_length_offset` new tokens, capped at MAX_LENGTH.
+        """
+        self.batch_size = batch_size
+        self.num_beams = num_beams
+        self.max_length_ratio = max_length_ratio
+        self.max_length_offset = max_length_offset
+        self.num_threads = num_threads
+        self.quantize = quantize
+        self.device = 0 if self.USE_CUDA and torch.cuda.is_available() else -1
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        model_name = self.NLLB_MODELS.get(model_name, model_name)
+        print(f">>> Loading NLLB translation model {model_name}...")
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        self.model = self._load_model(model_name)
         if self.device == 0:
+            if quantize:
+                print(">>> NLLB int8 quantization is only used on the CPU")
             self.model.to("cuda")
+        elif quantize:
+            self.model = self._quantize(self.model)
+        print(
+            f">>> NLLB ready on {'cuda' if self.device == 0 else 'cpu'} "
+            f"(int8: {bool(quantize) and self.device != 0}, "
+            f"threads: {torch.get_num_threads()}, beams: {num_beams})"
+        )
 
-    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
-        try:
-            inputs = self.tokenizer(
-                sentence, return_tensors="pt", truncation=True, max_length=512
-            )
-            if self.device == 0:
-                inputs = {k: v.cuda() for k, v in inputs.items()}
-            forced_token = self.tokenizer._convert_token_to_id_with_added_voc(dest_lang)
+    def _load_model(self, model_name):
+        return AutoModelForSeq2SeqLM.from_pretrained(model_name)
+
+    def _quantize(self, model):
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def _max_new_tokens(self, input_length):
+        limit = int(input_length * self.max_length_ratio) + self.max_length_offset
+        return min(limit, self.MAX_LENGTH)
+
+    def _generate(self, sentences: List[str], dest_lang: str) -> List[str]:
+        inputs = self.tokenizer(
+            sentences,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=self.MAX_LENGTH,
+        )
+        if self.device == 0:
+            inputs = {k: v.cuda() for k, v in inputs.items()}
+        forced_token = self.tokenizer._convert_token_to_id_with_added_voc(dest_lang)
+        with torch.inference_mode():
             output = self.model.generate(
                 **inputs,
                 forced_bos_token_id=forced_token,
-                max_new_tokens=512,
-                num_beams=4,
+                max_new_tokens=self._max_new_tokens(inputs["input_ids"].shape[1]),
+                num_beams=self.num_beams,
             )
-            return self.tokenizer.decode(output[0], skip_special_tokens=True)
+        return self.tokenizer.batch_decode(output, skip_special_tokens=True)
+
+    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+        try:
+            return self._generate([sentence], dest_lang)[0]
         except Exception as e:
             print(f"Translation error (NLLB): {e}")
             return sentence  # Return original sentence on error
 
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        translated = []
+        for start in range(0, len(sentences), self.batch_size):
+            batch = sentences[start : start + self.batch_size]
+            try:
+                translated.extend(self._generate(batch, dest_lang))
+            except Exception as e:
+                print(f"Translation error (NLLB): {e}")
+                translated.extend(batch)  # Return original sentences on error
+        return translated
+
     def get_lang_map(self) -> Dict[str, str]:
         return self.NLLB_LANG_MAP
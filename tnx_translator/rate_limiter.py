@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """Token bucket and AIMD concurrency window for one provider's quota.
+
+    Every request takes a token; tokens refill at `qps` up to `burst`
+    (without a qps there is no bucket). The default burst of one spaces
+    requests evenly, so no one-second window sees more than the quota.
+
+    At most `concurrency` requests are in flight. The window grows by one
+    per window's worth of requests that went through (additive increase)
+    and is halved, and the bucket emptied, whenever the provider reports
+    throttling (multiplicative decrease), staying between 1 and
+    `max_concurrency`. Time requests spend waiting for a token or a free
+    slot is recorded as queue time.
+
+    Usable from threads (`acquire`) and from an event loop
+    (`acquire_async`); every acquire is paired with a `release`.
+    """
+
+    # How often a coroutine waiting for a free slot checks again
+    POLL_INTERVAL = 0.005
+
+    def __init__(
+        self,
+        qps: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: int = 4,
+        decrease: float = 0.5,
+    ):
+        self.qps = qps
+        self.burst = burst if burst is not None else 1.0
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.concurrency = float(max_concurrency)
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self.requests = 0
+        self.throttled = 0
+        self.queue_time = 0.0
+        self.max_queue_time = 0.0
+
+    def _try_acquire(self) -> Optional[float]:
+        """Take a slot and a token. Returns 0 on success, otherwise the seconds
+        until a token is due, or None when waiting for a slot to be released."""
+        if self._in_flight >= int(self.concurrency):
+            return None
+        if self.qps:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled) * self.qps
+            )
+            self._refilled = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.qps
+            self._tokens -= 1
+        self._in_flight += 1
+        return 0
+
+    def _record(self, queued: float):
+        self.requests += 1
+        self.queue_time += queued
+        self.max_queue_time = max(self.max_queue_time, queued)
+
+    def acquire(self):
+        start = time.monotonic()
+        with self._lock:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0:
+                    break
+                self._released.wait(wait)
+            self._record(time.monotonic() - start)
+
+    async def acquire_async(self):
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                wait = self._try_acquire()
+                if wait == 0:
+                    self._record(time.monotonic() - start)
+                    return
+            await asyncio.sleep(self.POLL_INTERVAL if wait is None else wait)
+
+    def release(self, throttled: bool = False):
+        with self._lock:
+            self._in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.concurrency = max(1.0, self.concurrency * self.decrease)
+                self._tokens = min(self._tokens, 0.0)
+            else:
+                self.concurrency = min(
+                    float(self.max_concurrency), self.concurrency + 1 / self.concurrency
+                )
+            self._released.notify_all()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "qps": self.qps,
+                "concurrency": round(self.concurrency, 2),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "queue_ms_avg": (
+                    1000 * self.queue_time / self.requests if self.requests else 0.0
+                ),
+                "queue_ms_max": 1000 * self.max_queue_time,
+            }
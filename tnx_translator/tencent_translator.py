@@ -5,6 +5,7 @@ import time
 import hashlib
 from typing import List, Dict
 from .translator_interface import Translator
+from .http_session import PooledSession, create_async_session
 
 
 class TencentTranslator(Translator):
@@ -19,12 +20,22 @@ class TencentTranslator(Translator):
         "zht": "zh-TW",
         "ukr": "uk",
     }
+    # TextTranslateBatch rejects requests whose texts exceed 6000 characters in total
+    MAX_BATCH_CHARS = 6000
+    # Rate limit errors slow the limiter down; internal errors are only retried
+    THROTTLE_ERROR_PREFIXES = ("RequestLimitExceeded", "LimitExceeded")
+    RETRY_ERROR_PREFIXES = ("InternalError",)
+    # Machine translation allows 5 requests per second by default
+    max_concurrency = 5
 
-    def __init__(self, secret_id: str = None, secret_key: str = None):
+    def __init__(
+        self, secret_id: str = None, secret_key: str = None, **session_options
+    ):
         """
         Initialize the Tencent Translator.
         :param secret_id: Your Tencent Cloud Secret ID.
         :param secret_key: Your Tencent Cloud Secret Key.
+        :param session_options: Pool size, timeouts, retries and rate limiter for PooledSession.
         """
         if not secret_id or not secret_key:
             raise ValueError(
@@ -33,6 +44,13 @@ class TencentTranslator(Translator):
         self.secret_id = secret_id
         self.secret_key = secret_key
         self.api_url = "https://tmt.tencentcloudapi.com"
+        self.session_options = session_options
+        self.session = PooledSession(
+            is_throttled=self._is_throttled,
+            is_transient=self._is_transient,
+            **session_options,
+        )
+        self.async_session = None
         print(
             ">>> Tencent Translate initialized. Ensure Secret ID and Secret Key are correctly set."
         )
@@ -86,42 +104,53 @@ class TencentTranslator(Translator):
 
         return authorization
 
-    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
-        timestamp = int(time.time())
-        params = {
-            "SourceText": sentence,
-            "Source": src_lang,
-            "Target": dest_lang,
-            "ProjectId": 0,
-        }
+    def _get_async_session(self):
+        if self.async_session is None:
+            self.async_session = create_async_session(
+                is_throttled=self._is_throttled,
+                is_transient=self._is_transient,
+                max_concurrency=self.max_concurrency,
+                **self.session_options,
+            )
+        return self.async_session
 
-        headers = {
+    def _call_headers(self, action: str, params: Dict) -> Dict[str, str]:
+        timestamp = int(time.time())
+        return {
             "Content-Type": "application/json; charset=utf-8",
             "Host": "tmt.tencentcloudapi.com",
-            "X-TC-Action": "TextTranslate",
+            "X-TC-Action": action,
             "X-TC-Timestamp": str(timestamp),
             "X-TC-Version": "2018-03-21",
             "X-TC-Region": "ap-guangzhou",
             "Authorization": self._generate_sign(params, timestamp),
         }
 
-        try:
-            response = requests.post(
-                self.api_url, data=json.dumps(params), headers=headers
+    def _call_result(self, response):
+        """`Response` object of a requests or httpx response, or None on API error."""
+        response.raise_for_status()
+        result = response.json()
+
+        if "Response" in result and "Error" in result["Response"]:
+            error = result["Response"]["Error"]
+            print(
+                f"Tencent API Error: {error.get('Code')} - {error.get('Message', 'Unknown error')}"
             )
-            response.raise_for_status()
-            result = response.json()
-
-            if "Response" in result and "TargetText" in result["Response"]:
-                return result["Response"]["TargetText"]
-            elif "Response" in result and "Error" in result["Response"]:
-                error = result["Response"]["Error"]
-                print(
-                    f"Tencent API Error: {error.get('Code')} - {error.get('Message', 'Unknown error')}"
-                )
-            else:
-                print(f"Tencent API Error: Unexpected response format: {result}")
+        elif "Response" in result:
+            return result["Response"]
+        else:
+            print(f"Tencent API Error: Unexpected response format: {result}")
+        return None
 
+    def _call(self, action: str, params: Dict):
+        """Send a signed API request and return its `Response` object, or None on error."""
+        try:
+            response = self.session.post(
+                self.api_url,
+                data=json.dumps(params),
+                headers=self._call_headers(action, params),
+            )
+            return self._call_result(response)
         except requests.exceptions.RequestException as e:
             print(f"Translation error (Tencent HTTP): {e}")
         except json.JSONDecodeError as e:
@@ -131,7 +160,107 @@ class TencentTranslator(Translator):
         except Exception as e:
             print(f"Translation error (Tencent): {e}")
 
+        return None
+
+    async def _call_async(self, action: str, params: Dict):
+        response = None
+        try:
+            response = await self._get_async_session().post(
+                self.api_url,
+                content=json.dumps(params),
+                headers=self._call_headers(action, params),
+            )
+            return self._call_result(response)
+        except json.JSONDecodeError as e:
+            print(
+                f"Translation error (Tencent JSON Decode): {e} - Response: {response.text}"
+            )
+        except Exception as e:
+            print(f"Translation error (Tencent HTTP): {e}")
+        return None
+
+    @staticmethod
+    def _error_code(result: Dict) -> str:
+        return result.get("Response", {}).get("Error", {}).get("Code", "")
+
+    def _is_throttled(self, result: Dict) -> bool:
+        return self._error_code(result).startswith(self.THROTTLE_ERROR_PREFIXES)
+
+    def _is_transient(self, result: Dict) -> bool:
+        return self._error_code(result).startswith(self.RETRY_ERROR_PREFIXES)
+
+    def _translate_params(self, sentence: str, src_lang: str, dest_lang: str) -> Dict:
+        return {
+            "SourceText": sentence,
+            "Source": src_lang,
+            "Target": dest_lang,
+            "ProjectId": 0,
+        }
+
+    def _translate_result(self, result, sentence: str) -> str:
+        if result and "TargetText" in result:
+            return result["TargetText"]
+        if result is not None:
+            print(f"Tencent API Error: Unexpected response format: {result}")
         return sentence  # Return original sentence on error
 
+    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+        params = self._translate_params(sentence, src_lang, dest_lang)
+        return self._translate_result(self._call("TextTranslate", params), sentence)
+
+    async def translate_async(
+        self, sentence: str, src_lang: str, dest_lang: str
+    ) -> str:
+        params = self._translate_params(sentence, src_lang, dest_lang)
+        result = await self._call_async("TextTranslate", params)
+        return self._translate_result(result, sentence)
+
+    def _batch_params(self, batch: List[str], src_lang: str, dest_lang: str) -> Dict:
+        return {
+            "Source": src_lang,
+            "Target": dest_lang,
+            "ProjectId": 0,
+            "SourceTextList": batch,
+        }
+
+    def _batch_result(self, result, batch: List[str]) -> List[str]:
+        target_list = (result or {}).get("TargetTextList")
+        if target_list and len(target_list) == len(batch):
+            return target_list
+        if result is not None:
+            print(f"Tencent API Error: Unexpected response format: {result}")
+        return batch  # Return original sentences on error
+
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        translated = []
+        for batch in self._split_batches(sentences, self.MAX_BATCH_CHARS):
+            params = self._batch_params(batch, src_lang, dest_lang)
+            result = self._call("TextTranslateBatch", params)
+            translated.extend(self._batch_result(result, batch))
+        return translated
+
+    def _async_requests(self, sentences: List[str], src_lang: str, dest_lang: str):
+        batches = self._split_batches(sentences, self.MAX_BATCH_CHARS)
+        return [
+            self._translate_chunk_async(offset, batch, src_lang, dest_lang)
+            for offset, batch in zip(self._batch_offsets(batches), batches)
+        ]
+
+    async def _translate_chunk_async(self, offset, batch, src_lang, dest_lang):
+        params = self._batch_params(batch, src_lang, dest_lang)
+        result = await self._call_async("TextTranslateBatch", params)
+        indices = list(range(offset, offset + len(batch)))
+        return indices, self._batch_result(result, batch)
+
     def get_lang_map(self) -> Dict[str, str]:
         return self.TENCENT_LANG_MAP
+
+    def get_stats(self) -> Dict:
+        stats = {"http": self.session.stats()}
+        if self.async_session is not None:
+            stats["async_http"] = self.async_session.stats()
+        if self.session.rate_limiter is not None:
+            stats["rate_limit"] = self.session.rate_limiter.stats()
+        return stats
@@ -1,4 +1,89 @@
-def get_translator(translator_type="google"):
+import os
+from .rate_limiter import RateLimiter
+
+# Optional tuning of the pooled HTTP session used by the cloud translators
+HTTP_SESSION_ENV = {
+    "pool_size": ("TRANX_HTTP_POOL_SIZE", int),
+    "connect_timeout": ("TRANX_HTTP_CONNECT_TIMEOUT", float),
+    "read_timeout": ("TRANX_HTTP_READ_TIMEOUT", float),
+    "max_retries": ("TRANX_HTTP_MAX_RETRIES", int),
+    "backoff_factor": ("TRANX_HTTP_BACKOFF", float),
+}
+
+
+def _env_flag(value):
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Optional CPU/GPU tuning of the local NLLB model
+NLLB_ENV = {
+    "model_name": ("TRANX_NLLB_MODEL", str),
+    "quantize": ("TRANX_NLLB_QUANTIZE", _env_flag),
+    "num_threads": ("TRANX_NLLB_THREADS", int),
+    "num_beams": ("TRANX_NLLB_BEAMS", int),
+    "max_length_ratio": ("TRANX_NLLB_MAX_LENGTH_RATIO", float),
+    "batch_size": ("TRANX_NLLB_BATCH_SIZE", int),
+}
+
+
+# Requests per second in each provider's default quota. TRANX_<TYPE>_QPS
+# (e.g. TRANX_BAIDU_QPS=10 for Baidu's advanced tier) overrides them; 0 or
+# no entry leaves only the adaptive concurrency limit. The quota is shared by
+# the account, so it is split evenly between the server's worker processes.
+PROVIDER_QPS = {
+    "baidu": 1,
+    "tencent": 5,
+    "youdao": None,
+    "aliyun": 50,
+}
+
+
+def _get_env_options(env_options):
+    options = {}
+    for option, (env_name, cast) in env_options.items():
+        value = os.environ.get(env_name)
+        if value:
+            options[option] = cast(value)
+    return options
+
+
+def get_http_session_options():
+    return _get_env_options(HTTP_SESSION_ENV)
+
+
+def get_nllb_options():
+    return _get_env_options(NLLB_ENV)
+
+
+def _get_max_concurrency(translator_class):
+    # Overrides the backend's own limit of concurrent requests
+    value = os.environ.get("TRANX_ASYNC_CONCURRENCY")
+    return int(value) if value else translator_class.max_concurrency
+
+
+def get_rate_limiter(translator_type, translator_class, workers=1):
+    qps = PROVIDER_QPS.get(translator_type)
+    value = os.environ.get(f"TRANX_{translator_type.upper()}_QPS")
+    if value:
+        qps = float(value) or None
+    if qps and workers > 1:
+        print(
+            f">>> {translator_type} quota of {qps:g} requests/s is split between "
+            f"{workers} workers ({qps / workers:g} each)"
+        )
+        qps /= workers
+    return RateLimiter(qps, max_concurrency=_get_max_concurrency(translator_class))
+
+
+def get_translator(translator_type="google", workers=1):
+    """Create a translator; `workers` is the number of server processes that
+    share the provider's quota."""
+    translator = _create_translator(translator_type, workers)
+    translator.max_concurrency = _get_max_concurrency(type(translator))
+    return translator
+
+
+def _create_translator(translator_type, workers):
     if translator_type == "google":
         from .google_translator import GoogleWebTranslator
 
@@ -7,13 +92,25 @@ def get_translator(translator_type="google"):
         try:
             from .nllb_translator import NLLBTranslator
 
-            return NLLBTranslator()
+            return NLLBTranslator(**get_nllb_options())
         except ImportError:
             raise ImportError(
                 "NLLB dependencies not installed. Run: pip install transformers torch"
             )
+    elif translator_type == "nllb_onnx":
+        try:
+            from .nllb_onnx_translator import NLLBOnnxTranslator
+        except ImportError:
+            raise ImportError(
+                "NLLB ONNX dependencies not installed. "
+                "Run: pip install transformers torch optimum[onnxruntime]"
+            )
+        options = get_nllb_options()
+        export_dir = os.environ.get("TRANX_NLLB_ONNX_DIR")
+        if export_dir:
+            options["export_dir"] = export_dir
+        return NLLBOnnxTranslator(**options)
     elif translator_type == "baidu":
-        import os
         from .baidu_translator import BaiduTranslator
 
         app_id = os.environ.get("BAIDU_TRANSLATOR_APP_ID")
@@ -23,9 +120,13 @@ def get_translator(translator_type="google"):
                 "Baidu App ID (BAIDU_TRANSLATOR_APP_ID) and App Key (BAIDU_TRANSLATOR_APP_KEY) must be set as environment variables. "
                 "Please refer to the README.md for instructions on how to set them up."
             )
-        return BaiduTranslator(app_id=app_id, app_key=app_key)
+        return BaiduTranslator(
+            app_id=app_id,
+            app_key=app_key,
+            rate_limiter=get_rate_limiter("baidu", BaiduTranslator, workers),
+            **get_http_session_options(),
+        )
     elif translator_type == "aliyun":
-        import os
         from .aliyun_translator import AliyunTranslator
 
         access_key_id = os.environ.get("ALIYUN_TRANSLATOR_ACCESS_KEY_ID")
@@ -36,11 +137,12 @@ def get_translator(translator_type="google"):
                 "must be set as environment variables. Please refer to the README.md for instructions on how to set them up."
             )
         return AliyunTranslator(
-            access_key_id=access_key_id, access_key_secret=access_key_secret
+            access_key_id=access_key_id,
+            access_key_secret=access_key_secret,
+            rate_limiter=get_rate_limiter("aliyun", AliyunTranslator, workers),
         )
 
     elif translator_type == "tencent":
-        import os
         from .tencent_translator import TencentTranslator
 
         secret_id = os.environ.get("TENCENT_TRANSLATOR_SECRET_ID")
@@ -50,10 +152,14 @@ def get_translator(translator_type="google"):
                 "Tencent Secret ID (TENCENT_TRANSLATOR_SECRET_ID) and Secret Key (TENCENT_TRANSLATOR_SECRET_KEY) "
                 "must be set as environment variables. Please refer to the README.md for instructions on how to set them up."
             )
-        return TencentTranslator(secret_id=secret_id, secret_key=secret_key)
+        return TencentTranslator(
+            secret_id=secret_id,
+            secret_key=secret_key,
+            rate_limiter=get_rate_limiter("tencent", TencentTranslator, workers),
+            **get_http_session_options(),
+        )
 
     elif translator_type == "youdao":
-        import os
         from .youdao_translator import YoudaoTranslator
 
         app_key = os.environ.get("YOUDAO_TRANSLATOR_APP_KEY")
@@ -63,6 +169,11 @@ def get_translator(translator_type="google"):
                 "Youdao App Key (YOUDAO_TRANSLATOR_APP_KEY) and App Secret (YOUDAO_TRANSLATOR_APP_SECRET) "
                 "must be set as environment variables. Please refer to the README.md for instructions on how to set them up."
             )
-        return YoudaoTranslator(app_key=app_key, app_secret=app_secret)
+        return YoudaoTranslator(
+            app_key=app_key,
+            app_secret=app_secret,
+            rate_limiter=get_rate_limiter("youdao", YoudaoTranslator, workers),
+            **get_http_session_options(),
+        )
     else:
         raise ValueError(f"Unsupported translator: {translator_type}")
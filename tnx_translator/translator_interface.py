@@ -1,19 +1,133 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Tuple
 
 
 class Translator(ABC):
+    # Requests a backend may have in flight at once on the async path
+    max_concurrency = 4
+
     @abstractmethod
     def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
         pass
 
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        """Translate several sentences, keeping their order.
+
+        Backends with a native batch endpoint override this; the default
+        falls back to one `translate` call per sentence.
+        """
+        return [self.translate(sentence, src_lang, dest_lang) for sentence in sentences]
+
+    def _async_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding this backend's concurrent requests on the running loop."""
+        loop = asyncio.get_running_loop()
+        limit = getattr(self, "_async_limit_state", None)
+        if limit is None or limit[0] is not loop:
+            limit = (loop, asyncio.Semaphore(self.max_concurrency))
+            self._async_limit_state = limit
+        return limit[1]
+
+    async def translate_async(
+        self, sentence: str, src_lang: str, dest_lang: str
+    ) -> str:
+        """Translate on an event loop.
+
+        The default runs the blocking `translate` in a worker thread.
+        """
+        async with self._async_limit():
+            return await asyncio.to_thread(
+                self.translate, sentence, src_lang, dest_lang
+            )
+
+    def _async_requests(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[Awaitable[Tuple[List[int], List[str]]]]:
+        """Coroutines that together translate `sentences`, each resolving to
+        (indices, translations).
+
+        HTTP backends with a batch endpoint return one per request. The
+        default is one `translate_async` per sentence, or a single
+        `translate_batch` in a worker thread when the backend has its own.
+        """
+        if type(self).translate_batch is not Translator.translate_batch:
+
+            async def translate_all():
+                async with self._async_limit():
+                    translations = await asyncio.to_thread(
+                        self.translate_batch, sentences, src_lang, dest_lang
+                    )
+                return list(range(len(sentences))), translations
+
+            return [translate_all()]
+
+        async def translate_one(index, sentence):
+            return [index], [await self.translate_async(sentence, src_lang, dest_lang)]
+
+        return [translate_one(i, sentence) for i, sentence in enumerate(sentences)]
+
+    async def translate_as_completed_async(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Request all sentences at once; yield (index, translation) as they finish."""
+        for request in asyncio.as_completed(
+            self._async_requests(sentences, src_lang, dest_lang)
+        ):
+            indices, translations = await request
+            for index, translation in zip(indices, translations):
+                yield index, translation
+
+    async def translate_batch_async(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        translated = [None] * len(sentences)
+        async for index, translation in self.translate_as_completed_async(
+            sentences, src_lang, dest_lang
+        ):
+            translated[index] = translation
+        return translated
+
     @abstractmethod
     def get_lang_map(self) -> Dict[str, str]:
         pass
 
+    def get_stats(self) -> Dict:
+        """Backend-specific runtime counters, reported by the server's /stats."""
+        return {}
+
     def convert_lang_code(self, lang_code: str, lang_codes: List[str]) -> str:
         lang_map = self.get_lang_map()
         for code in lang_codes:
             if code not in lang_map:
                 raise ValueError(f"Unsupported language code: {code}")
         return lang_map[lang_code]
+
+    @staticmethod
+    def _split_batches(
+        sentences: List[str],
+        max_size: int,
+        size: Callable[[str], int] = len,
+    ) -> List[List[str]]:
+        """Group sentences into consecutive chunks within an API's request limits."""
+        batches, current, current_size = [], [], 0
+        for sentence in sentences:
+            sentence_size = size(sentence)
+            if current and current_size + sentence_size > max_size:
+                batches.append(current)
+                current, current_size = [], 0
+            current.append(sentence)
+            current_size += sentence_size
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _batch_offsets(batches: List[List[str]]) -> List[int]:
+        """Index of each batch's first sentence in the sentences it was split from."""
+        offsets, offset = [], 0
+        for batch in batches:
+            offsets.append(offset)
+            offset += len(batch)
+        return offsets
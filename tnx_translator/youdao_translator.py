@@ -5,6 +5,7 @@ import uuid
 import hashlib
 from typing import List, Dict
 from .translator_interface import Translator
+from .http_session import PooledSession, create_async_session
 
 
 class YoudaoTranslator(Translator):
@@ -19,12 +20,18 @@ class YoudaoTranslator(Translator):
         "zht": "zh-CHT",
         "ukr": "uk",
     }
+    # The batch endpoint limits the total length of all `q` values
+    MAX_BATCH_CHARS = 5000
+    # 411 access frequency limited, 412 too many long requests
+    THROTTLE_ERROR_CODES = {"411", "412"}
+    max_concurrency = 4
 
-    def __init__(self, app_key: str = None, app_secret: str = None):
+    def __init__(self, app_key: str = None, app_secret: str = None, **session_options):
         """
         Initialize the Youdao Translator.
         :param app_key: Your Youdao Translate API App Key.
         :param app_secret: Your Youdao Translate API App Secret.
+        :param session_options: Pool size, timeouts, retries and rate limiter for PooledSession.
         """
         if not app_key or not app_secret:
             raise ValueError(
@@ -33,6 +40,10 @@ class YoudaoTranslator(Translator):
         self.app_key = app_key
         self.app_secret = app_secret
         self.api_url = "https://openapi.youdao.com/api"
+        self.batch_api_url = "https://openapi.youdao.com/v2/api"
+        self.session_options = session_options
+        self.session = PooledSession(is_throttled=self._is_throttled, **session_options)
+        self.async_session = None
         print(
             ">>> Youdao Translate initialized. Ensure App Key and App Secret are correctly set."
         )
@@ -54,13 +65,31 @@ class YoudaoTranslator(Translator):
         sign = hashlib.sha256(sign_str.encode("utf-8")).hexdigest()
         return sign
 
-    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+    def _is_throttled(self, result: Dict) -> bool:
+        return result.get("errorCode") in self.THROTTLE_ERROR_CODES
+
+    def _get_async_session(self):
+        if self.async_session is None:
+            self.async_session = create_async_session(
+                is_throttled=self._is_throttled,
+                max_concurrency=self.max_concurrency,
+                **self.session_options,
+            )
+        return self.async_session
+
+    def _request_params(self, query, src_lang: str, dest_lang: str) -> Dict:
+        """Signed query parameters.
+
+        `query` is either a single sentence or a list of sentences; for a
+        list the signature is computed over their concatenation.
+        """
         salt = str(uuid.uuid4())
         timestamp = str(int(time.time()))
-        sign = self._generate_sign(sentence, salt, timestamp)
+        sign_input = query if isinstance(query, str) else "".join(query)
+        sign = self._generate_sign(sign_input, salt, timestamp)
 
         params = {
-            "q": sentence,
+            "q": query,
             "from": src_lang,
             "to": dest_lang,
             "appKey": self.app_key,
@@ -69,21 +98,27 @@ class YoudaoTranslator(Translator):
             "signType": "v3",
             "curtime": timestamp,
         }
+        return params
 
-        try:
-            response = requests.get(self.api_url, params=params)
-            response.raise_for_status()
-            result = response.json()
+    def _request_result(self, response):
+        """Decoded JSON of a requests or httpx response, or None on API error."""
+        response.raise_for_status()
+        result = response.json()
 
-            if "translation" in result and result["translation"]:
-                return " ".join(result["translation"])
-            elif "errorCode" in result and result["errorCode"] != "0":
-                print(
-                    f"Youdao API Error: {result.get('errorCode')} - {result.get('msg', 'Unknown error')}"
-                )
-            else:
-                print(f"Youdao API Error: Unexpected response format: {result}")
+        if result.get("errorCode", "0") == "0":
+            return result
+        print(
+            f"Youdao API Error: {result.get('errorCode')} - {result.get('msg', 'Unknown error')}"
+        )
+        return None
 
+    def _request(self, url: str, query, src_lang: str, dest_lang: str):
+        """Send a signed request and return the decoded JSON, or None on error."""
+        try:
+            response = self.session.get(
+                url, params=self._request_params(query, src_lang, dest_lang)
+            )
+            return self._request_result(response)
         except requests.exceptions.RequestException as e:
             print(f"Translation error (Youdao HTTP): {e}")
         except json.JSONDecodeError as e:
@@ -93,7 +128,81 @@ class YoudaoTranslator(Translator):
         except Exception as e:
             print(f"Translation error (Youdao): {e}")
 
+        return None
+
+    async def _request_async(self, url: str, query, src_lang: str, dest_lang: str):
+        response = None
+        try:
+            response = await self._get_async_session().get(
+                url, params=self._request_params(query, src_lang, dest_lang)
+            )
+            return self._request_result(response)
+        except json.JSONDecodeError as e:
+            print(
+                f"Translation error (Youdao JSON Decode): {e} - Response: {response.text}"
+            )
+        except Exception as e:
+            print(f"Translation error (Youdao HTTP): {e}")
+        return None
+
+    def _translate_result(self, result, sentence: str) -> str:
+        if result is not None:
+            if result.get("translation"):
+                return " ".join(result["translation"])
+            print(f"Youdao API Error: Unexpected response format: {result}")
         return sentence  # Return original sentence on error
 
+    def translate(self, sentence: str, src_lang: str, dest_lang: str) -> str:
+        result = self._request(self.api_url, sentence, src_lang, dest_lang)
+        return self._translate_result(result, sentence)
+
+    async def translate_async(
+        self, sentence: str, src_lang: str, dest_lang: str
+    ) -> str:
+        result = await self._request_async(self.api_url, sentence, src_lang, dest_lang)
+        return self._translate_result(result, sentence)
+
+    def _batch_result(self, result, batch: List[str]) -> List[str]:
+        results = (result or {}).get("translateResults") or []
+        if len(results) == len(batch):
+            return [
+                item.get("translation") or sentence
+                for item, sentence in zip(results, batch)
+            ]
+        if result is not None:
+            print(f"Youdao API Error: Unexpected response format: {result}")
+        return batch  # Return original sentences on error
+
+    def translate_batch(
+        self, sentences: List[str], src_lang: str, dest_lang: str
+    ) -> List[str]:
+        translated = []
+        for batch in self._split_batches(sentences, self.MAX_BATCH_CHARS):
+            result = self._request(self.batch_api_url, batch, src_lang, dest_lang)
+            translated.extend(self._batch_result(result, batch))
+        return translated
+
+    def _async_requests(self, sentences: List[str], src_lang: str, dest_lang: str):
+        batches = self._split_batches(sentences, self.MAX_BATCH_CHARS)
+        return [
+            self._translate_chunk_async(offset, batch, src_lang, dest_lang)
+            for offset, batch in zip(self._batch_offsets(batches), batches)
+        ]
+
+    async def _translate_chunk_async(self, offset, batch, src_lang, dest_lang):
+        result = await self._request_async(
+            self.batch_api_url, batch, src_lang, dest_lang
+        )
+        indices = list(range(offset, offset + len(batch)))
+        return indices, self._batch_result(result, batch)
+
     def get_lang_map(self) -> Dict[str, str]:
         return self.YOUDAO_LANG_MAP
+
+    def get_stats(self) -> Dict:
+        stats = {"http": self.session.stats()}
+        if self.async_session is not None:
+            stats["async_http"] = self.async_session.stats()
+        if self.session.rate_limiter is not None:
+            stats["rate_limit"] = self.session.rate_limiter.stats()
+        return stats
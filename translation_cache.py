@@ -0,0 +1,66 @@
+import sys
+import threading
+from collections import OrderedDict
+
+
+class TranslationLRU:
+    """Bounded in-process cache of translations, checked before SQLite.
+
+    Keys are (pid, src_lang, dest_lang, translator_type, text). The cache is
+    limited both by entry count and by the approximate size of the stored
+    strings; least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(key, value):
+        return sys.getsizeof(key[-1]) + sys.getsizeof(value)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= self._entry_size(key, previous)
+            self._entries[key] = value
+            self.size_bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.size_bytes > self.max_bytes
+            ):
+                old_key, old_value = self._entries.popitem(last=False)
+                self.size_bytes -= self._entry_size(old_key, old_value)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,111 @@
+import atexit
+import hashlib
+import sqlite3
+import threading
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class TranslationDB:
+    """Long-lived connection to one `<src>_<dst>_<translator>.db` cache file.
+
+    The connection is opened once in WAL mode and shared by all requests;
+    lookups for a whole frame run as a single `IN (...)` query and new
+    translations are written in one transaction.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8192",
+    )
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS translations (
+            original_hash TEXT PRIMARY KEY,
+            original_text TEXT UNIQUE,
+            translated_text TEXT
+        )
+        """
+    INSERT = """
+        INSERT OR IGNORE INTO translations
+        (original_hash, original_text, translated_text)
+        VALUES (?, ?, ?)
+        """
+    SELECT = (
+        "SELECT original_hash, translated_text FROM translations "
+        "WHERE original_hash IN ({})"
+    )
+    # IN lists are padded to one of these sizes so that only a handful of
+    # distinct statements exist and all of them stay in the statement cache.
+    LOOKUP_SIZES = (1, 4, 16, 64, 256)
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, cached_statements=len(self.LOOKUP_SIZES) + 8
+        )
+        for pragma in self.PRAGMAS:
+            self._conn.execute(pragma)
+        self._conn.execute(self.CREATE_TABLE)
+        self._conn.commit()
+        self._selects = {
+            size: self.SELECT.format(", ".join("?" * size))
+            for size in self.LOOKUP_SIZES
+        }
+
+    def lookup_many(self, texts):
+        """Return {text: translation} for the texts present in the cache."""
+        hashes = {text_hash(text): text for text in texts}
+        found = {}
+        pending = list(hashes)
+        max_size = self.LOOKUP_SIZES[-1]
+        with self._lock:
+            for start in range(0, len(pending), max_size):
+                chunk = pending[start : start + max_size]
+                size = next(s for s in self.LOOKUP_SIZES if s >= len(chunk))
+                chunk += chunk[-1:] * (size - len(chunk))
+                for original_hash, translated in self._conn.execute(
+                    self._selects[size], chunk
+                ):
+                    found[hashes[original_hash]] = translated
+        return found
+
+    def store_many(self, translations):
+        """Insert (original, translated) pairs in a single transaction."""
+        rows = [
+            (text_hash(original), original, translated)
+            for original, translated in translations
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(self.INSERT, rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_databases = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(path):
+    with _databases_lock:
+        db = _databases.get(path)
+        if db is None:
+            db = TranslationDB(path)
+            _databases[path] = db
+        return db
+
+
+@atexit.register
+def close_all():
+    with _databases_lock:
+        for db in _databases.values():
+            db.close()
+        _databases.clear()
@@ -0,0 +1,74 @@
+import threading
+import time
+
+
+class WarmUp:
+    """Named startup tasks run in parallel background threads.
+
+    Each task's state ("pending", "running", "done" or "failed") and
+    duration are kept for the readiness endpoint, which reports ready once
+    every task is done and none failed. Request handlers that need
+    something a task provides call `wait(name)` before using it.
+    """
+
+    def __init__(self):
+        self._tasks = {}  # name -> {"state", "seconds", "error"}
+        self._events = {}  # name -> threading.Event set when the task ends
+        self._lock = threading.Lock()
+
+    def start(self, name, func, *args):
+        event = threading.Event()
+        with self._lock:
+            self._tasks[name] = {"state": "pending", "seconds": None, "error": None}
+            self._events[name] = event
+        thread = threading.Thread(
+            target=self._run, args=(name, event, func, args), daemon=True
+        )
+        thread.start()
+
+    def _run(self, name, event, func, args):
+        self._set(name, state="running")
+        start_time = time.perf_counter()
+        try:
+            func(*args)
+            self._set(name, state="done")
+        except Exception as e:
+            print(f"[ERROR] Warm-up of {name} failed: {e}")
+            self._set(name, state="failed", error=str(e))
+        finally:
+            self._set(name, seconds=round(time.perf_counter() - start_time, 3))
+            print(f">>> Warm-up of {name} finished")
+            event.set()
+
+    def _set(self, name, **values):
+        with self._lock:
+            self._tasks[name].update(values)
+
+    def wait(self, name=None, timeout=None):
+        """Block until task `name` (or every task) has ended. Unknown names don't block."""
+        with self._lock:
+            if name is None:
+                events = list(self._events.values())
+            else:
+                events = [self._events[name]] if name in self._events else []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for event in events:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not event.wait(remaining):
+                return False
+        return True
+
+    def _ready(self):
+        return all(task["state"] == "done" for task in self._tasks.values())
+
+    @property
+    def ready(self):
+        with self._lock:
+            return self._ready()
+
+    def status(self):
+        with self._lock:
+            return {
+                "ready": self._ready(),
+                "tasks": {name: dict(task) for name, task in self._tasks.items()},
+            }